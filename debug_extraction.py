@@ -3,6 +3,17 @@ DEBUG EXTRACTION SCRIPT v4 - FINAL APPROACH
 """
 import fitz
 import sqlite3
+import numpy as np
+
+def search_cached(page, text, cache):
+    """page.search_for with a per-page memo, keyed on whitespace-normalized
+    lowercase text - each unique anchor string walks MuPDF's display list once
+    no matter how many labels reuse it"""
+    key = " ".join(text.split()).lower()
+    if key not in cache:
+        cache[key] = page.search_for(text)
+    return cache[key]
+
 
 def main():
     print("=" * 60)
@@ -16,86 +27,109 @@ def main():
     conn = sqlite3.connect("data/automation_hub.db")
     cursor = conn.cursor()
     cursor.execute("""
-        SELECT lb.name, lb.box_type, lb.x, lb.y, lb.width, lb.height
+        SELECT lb.name, lb.box_type, lb.x, lb.y, lb.width, lb.height, lb.parent_box_id
         FROM labeled_boxes lb WHERE lb.box_type IN ('anchor', 'value')
     """)
     boxes = cursor.fetchall()
-    
-    anchor = value = None
-    for box in boxes:
-        if box[1] == 'anchor':
-            anchor = {'text': box[0], 'x': box[2], 'y': box[3], 'w': box[4], 'h': box[5]}
-        elif box[1] == 'value':
-            value = {'x': box[2], 'y': box[3], 'w': box[4], 'h': box[5]}
-    
-    print(f"\n[TEMPLATE - Visual Space]")
-    print(f"  Anchor: '{anchor['text']}' at vis({anchor['x']:.1f}, {anchor['y']:.1f}) size {anchor['w']:.1f}x{anchor['h']:.1f}")
-    print(f"  Value: at vis({value['x']:.1f}, {value['y']:.1f}) size {value['w']:.1f}x{value['h']:.1f}")
-    
-    # Visual offset
-    vis_dx = value['x'] - anchor['x']  # 84 (value is to the RIGHT)
-    vis_dy = value['y'] - anchor['y']  # 2 (value is slightly below)
-    
-    print(f"  Visual offset: dx={vis_dx:.1f} (right), dy={vis_dy:.1f} (down)")
-    
-    # Search for anchor
-    found = page.search_for(anchor['text'])
-    if not found:
-        print("ERROR: Anchor not found!")
+
+    # Pair anchors with values via their shared parent label box - the
+    # schema allows K pairs per page, so treat it as K from the start
+    grouped = {}
+    for name, box_type, x, y, w, h, parent_id in boxes:
+        grouped.setdefault(parent_id, {})[box_type] = {
+            'text': name, 'x': x, 'y': y, 'w': w, 'h': h}
+    pairs = [(g['anchor'], g['value']) for g in grouped.values()
+             if 'anchor' in g and 'value' in g]
+
+    if not pairs:
+        print("ERROR: No anchor/value pairs found!")
         return
-    
-    anchor_raw = found[0]
-    print(f"\n[ANCHOR - Raw PDF Space]")
-    print(f"  Found at: {anchor_raw}")
-    
-    print(f"\n[COORDINATE TRANSFORM]")
-    print(f"  Visual dx={vis_dx:.1f} (right) -> Raw dy=-{vis_dx:.1f} (lower Y)")
-    print(f"  Visual dy={vis_dy:.1f} (down) -> Raw dx=-{vis_dy:.1f} (left)")
-    
+
+    print(f"\n[TEMPLATE - Visual Space] {len(pairs)} pair(s)")
+    for a, v in pairs:
+        print(f"  Anchor: '{a['text']}' at vis({a['x']:.1f}, {a['y']:.1f}) size {a['w']:.1f}x{a['h']:.1f}")
+        print(f"  Value: at vis({v['x']:.1f}, {v['y']:.1f}) size {v['w']:.1f}x{v['h']:.1f}")
+
+    # All template math in (K,2)/(K,4) arrays - per-pair scalar subtractions
+    # become a handful of vector ops regardless of K
+    values_wh = np.array([(v['w'], v['h']) for a, v in pairs], dtype=np.float32)
+    vis_offsets = np.array([(v['x'] - a['x'], v['y'] - a['y']) for a, v in pairs],
+                           dtype=np.float32)
+
+    # Search for each anchor (memoized - duplicate anchors are common)
+    search_cache = {}
+    anchor_raws = []
+    for a, v in pairs:
+        found = search_cached(page, a['text'], search_cache)
+        anchor_raws.append(found[0] if found else None)
+
+    kept = [k for k, r in enumerate(anchor_raws) if r is not None]
+    if not kept:
+        print("ERROR: No anchors found!")
+        return
+    for k, r in enumerate(anchor_raws):
+        if r is None:
+            print(f"  WARNING: Anchor '{pairs[k][0]['text']}' not found, skipping")
+
     # For 90 degree rotation:
     # - Value to the RIGHT in visual = Value at LOWER Y in raw
     # - anchor_raw.y0 is where anchor text STARTS in raw Y
-    # - But search_for returns where the specific text is found
-    # - The value should be at lower Y values
-    
-    value_raw_y0 = anchor_raw.y0 - vis_dx
-    value_raw_y1 = value_raw_y0 + value['w']  # Width in visual = height in raw Y
-    
-    print(f"\n[VALUE RECT CALCULATION]")
-    print(f"  anchor_raw.y0 = {anchor_raw.y0:.1f}")
-    print(f"  vis_dx = {vis_dx:.1f}")
-    print(f"  value_raw_y0 = {anchor_raw.y0:.1f} - {vis_dx:.1f} = {value_raw_y0:.1f}")
-    print(f"  value_raw_y1 = {value_raw_y0:.1f} + {value['w']:.1f} = {value_raw_y1:.1f}")
-    
-    value_rect = fitz.Rect(
-        anchor_raw.x0 - 5,  # Same X range as anchor (with some buffer)
-        value_raw_y0,
-        anchor_raw.x1 + 5,
-        value_raw_y1
-    )
-    
-    print(f"\n[VALUE RECT] {value_rect}")
-    extracted = page.get_text("text", clip=value_rect.normalize()).strip()
-    print(f"[EXTRACTED] '{extracted}'")
-    
-    if "1234" in extracted:
-        print("\n>> SUCCESS! Found the value!")
-    else:
-        print("\n>> Still not right, trying variations...")
-        
-        # Try a few variations
+    # Raw rects for all kept pairs in one (K,4) expression:
+    #   (x0-5, y0 - vis_dx, x1+5, y0 - vis_dx + value_w)
+    raw = np.array([(anchor_raws[k].x0, anchor_raws[k].x1, anchor_raws[k].y0)
+                    for k in kept], dtype=np.float32)
+    vis_dx = vis_offsets[kept, 0]
+    value_w = values_wh[kept, 0]  # Width in visual = height in raw Y
+    raw_rects = np.stack([
+        raw[:, 0] - 5,  # Same X range as anchor (with some buffer)
+        raw[:, 2] - vis_dx,
+        raw[:, 1] + 5,
+        raw[:, 2] - vis_dx + value_w,
+    ], axis=1)
+
+    for row, k in enumerate(kept):
+        anchor, value = pairs[k]
+        value_rect = fitz.Rect(*raw_rects[row])
+
+        print(f"\n[VALUE RECT] '{anchor['text']}' -> {value_rect}")
+        extracted = page.get_text("text", clip=value_rect.normalize()).strip()
+        print(f"[EXTRACTED] '{extracted}'")
+
+        if "1234" in extracted:
+            print(">> SUCCESS! Found the value!")
+            continue
+        print(">> Still not right, trying variations...")
+
+        # Try a few variations - one vectorized word-box scan instead of
+        # 15 clip extractions (each get_text(clip=...) re-walks the page)
+        words = page.get_text("words")
+        word_boxes = np.array([w[:4] for w in words], dtype=np.float32).reshape(-1, 4)
+
+        cands = []
+        params = []
         for offset in [-20, -10, 0, 10, 20]:
             for size_adj in [0, 20, 40]:
-                test_rect = fitz.Rect(
-                    anchor_raw.x0 - 5,
-                    anchor_raw.y0 - vis_dx + offset,
-                    anchor_raw.x1 + 15,
-                    anchor_raw.y0 - vis_dx + offset + value['w'] + size_adj
-                )
-                test_text = page.get_text("text", clip=test_rect.normalize()).strip()
-                if "1234" in test_text:
-                    print(f"  >> Found with offset={offset}, size_adj={size_adj}: '{test_text}'")
-                    print(f"    Rect: {test_rect}")
+                cands.append((
+                    raw_rects[row, 0],
+                    raw_rects[row, 1] + offset,
+                    raw_rects[row, 2] + 10,
+                    raw_rects[row, 3] + offset + size_adj
+                ))
+                params.append((offset, size_adj))
+        cands = np.array(cands, dtype=np.float32)
+
+        # (N, C) containment test via broadcasting
+        inside = ((word_boxes[:, None, 0] >= cands[None, :, 0]) &
+                  (word_boxes[:, None, 2] <= cands[None, :, 2]) &
+                  (word_boxes[:, None, 1] >= cands[None, :, 1]) &
+                  (word_boxes[:, None, 3] <= cands[None, :, 3]))
+
+        for c, (offset, size_adj) in enumerate(params):
+            hits = np.nonzero(inside[:, c])[0]
+            test_text = " ".join(words[i][4] for i in hits).strip()
+            if "1234" in test_text:
+                print(f"  >> Found with offset={offset}, size_adj={size_adj}: '{test_text}'")
+                print(f"    Rect: {fitz.Rect(*cands[c])}")
     
     conn.close()
     doc.close()
@@ -4,13 +4,29 @@ Debug script to test actual OCR extraction flow with FIXED cropped-region extrac
 import sys
 sys.path.insert(0, '.')
 
-from modules import SessionLocal, OCRTemplate, OCRPage, LabeledBox
+import hashlib
+import json
+import zlib
+
+from modules import SessionLocal, OCRTemplate, OCRPage, LabeledBox, OCRWordCache
+from sqlalchemy.orm import selectinload
 import fitz
-from PIL import Image
+from PIL import Image, ImageFilter
 import numpy as np
 
 # Constants
-OCR_DPI = 300
+OCR_DPI = 200       # 200 DPI grayscale is enough for statement-style text (2.25x fewer pixels than 300)
+TEMPLATE_DPI = 300  # DPI the template box coordinates were captured at (ocr_module.OCR_DPI)
+TEMPLATE_SCALE = OCR_DPI / TEMPLATE_DPI
+
+
+def pdf_sha256(path):
+    """Stream-hash a PDF so cached OCR results key on its content"""
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            h.update(block)
+    return h.hexdigest()
 
 def main():
     # Load template from DB
@@ -23,15 +39,15 @@ def main():
     
     print(f"\n=== Using Template: {template.name} ===")
     
-    # Get first page
-    ocr_page = session.query(OCRPage).filter(OCRPage.template_id == template.id).first()
+    # Get first page with its whole box tree eagerly loaded - two batched
+    # SELECTs total instead of one query per relationship access
+    ocr_page = session.query(OCRPage).options(
+        selectinload(OCRPage.boxes).selectinload(LabeledBox.children)
+    ).filter(OCRPage.template_id == template.id).first()
     print(f"Template Page: {ocr_page.pdf_filename}")
-    
+
     # Get label boxes
-    label_boxes = session.query(LabeledBox).filter(
-        LabeledBox.page_id == ocr_page.id,
-        LabeledBox.box_type == 'label'
-    ).all()
+    label_boxes = [b for b in ocr_page.boxes if b.box_type == 'label']
     
     for lb in label_boxes:
         anchors = [b for b in lb.children if b.box_type == 'anchor']
@@ -73,7 +89,16 @@ def main():
     
     try:
         import easyocr
-        reader = easyocr.Reader(['en'], gpu=False, download_enabled=False)
+        import torch
+        # GPU inference is 5-20x faster for CRAFT+CRNN; cudnn_benchmark lets
+        # cuDNN autotune convolution algorithms for our fixed input shapes
+        use_gpu = torch.cuda.is_available()
+        reader = easyocr.Reader(['en'], gpu=use_gpu, cudnn_benchmark=use_gpu,
+                                download_enabled=False)
+        if use_gpu:
+            print("Using GPU (warming up)...")
+            # First GPU pass pays the cuDNN autotune / kernel compile cost
+            reader.readtext(np.zeros((600, 800, 3), dtype=np.uint8))
     except Exception as e:
         print(f"EasyOCR error: {e}")
         return
@@ -81,101 +106,196 @@ def main():
     doc = fitz.open(test_pdf)
     page = doc.load_page(0)
     
-    # Convert to image
-    pix = page.get_pixmap(matrix=fitz.Matrix(OCR_DPI/72, OCR_DPI/72))
-    img = Image.frombytes("RGB", [pix.width, pix.height], pix.samples)
-    img_array = np.array(img)
-    
-    print(f"Page image: {img.width} x {img.height}")
-    
-    # Run OCR on full page to find anchor
-    print("Running full-page OCR...")
-    ocr_results = reader.readtext(img_array)
-    
-    # Convert to word dicts
-    words = []
-    for bbox, text, conf in ocr_results:
-        x_coords = [p[0] for p in bbox]
-        y_coords = [p[1] for p in bbox]
-        words.append({
-            'text': text.strip(),
-            'left': min(x_coords),
-            'top': min(y_coords),
-            'width': max(x_coords) - min(x_coords),
-            'height': max(y_coords) - min(y_coords)
-        })
-    
-    print(f"Found {len(words)} OCR results")
-    
-    # For each label
+    # Convert to image - grayscale at reduced DPI, sharpened so the lower
+    # resolution keeps its OCR accuracy. PIL handles only the UnsharpMask;
+    # everything downstream works on one NumPy array (the old
+    # convert("RGB") + np.array round trip copied the page buffer twice)
+    pix = page.get_pixmap(matrix=fitz.Matrix(OCR_DPI/72, OCR_DPI/72), colorspace=fitz.csGRAY)
+    img = Image.frombytes("L", [pix.width, pix.height], pix.samples)
+    img = img.filter(ImageFilter.UnsharpMask(radius=2, percent=150, threshold=3))
+    # Widen gray to the 3 channels EasyOCR expects in one broadcast copy
+    img_array = np.repeat(np.asarray(img)[:, :, None], 3, axis=2)
+
+    print(f"Page image: {pix.width} x {pix.height}")
+
+    # Vector PDFs carry a selectable text layer - get_text("words") returns
+    # the same word boxes in milliseconds, so EasyOCR full-page detection is
+    # only needed for true scanned pages. Coordinates come back in PDF points
+    # and scale by OCR_DPI/72 to match the rasterized image.
+    pdf_words = page.get_text("words")
+
+    if pdf_words:
+        print(f"Using PDF text layer ({len(pdf_words)} words, skipping full-page OCR)")
+        pt_to_px = OCR_DPI / 72
+        texts = [w[4] for w in pdf_words]
+        coords = np.array([w[:4] for w in pdf_words], dtype=np.float32) * pt_to_px
+        boxes = np.stack([coords[:, 0], coords[:, 1],
+                          coords[:, 2] - coords[:, 0],
+                          coords[:, 3] - coords[:, 1]], axis=1)
+        run_ocr_path = False
+    else:
+        run_ocr_path = True
+
+    # Check the OCR cache first - full-page OCR is the dominant cost, and
+    # repeated debug runs on an unchanged PDF can reuse the stored word list.
+    if run_ocr_path:
+        pdf_hash = pdf_sha256(test_pdf)
+        cached = session.query(OCRWordCache).filter(
+            OCRWordCache.pdf_hash == pdf_hash,
+            OCRWordCache.page_number == 0,
+            OCRWordCache.dpi == OCR_DPI
+        ).first()
+    else:
+        cached = None
+
+    if run_ocr_path and cached:
+        payload = json.loads(zlib.decompress(cached.words_json))
+        texts = payload['texts']
+        boxes = np.array(payload['boxes'], dtype=np.float32).reshape(-1, 4)
+        print(f"Loaded {len(texts)} OCR results from cache")
+    elif run_ocr_path:
+        # Run OCR on full page to find anchor
+        print("Running full-page OCR...")
+        ocr_results = reader.readtext(img_array)
+
+        # SoA layout: one (N,4) float32 array of (left, top, width, height)
+        # plus a parallel text list, instead of N small per-word dicts.
+        # min/max over the 4 corner points runs at C level along the axis.
+        texts = [text.strip() for bbox, text, conf in ocr_results]
+        if ocr_results:
+            pts = np.array([bbox for bbox, text, conf in ocr_results],
+                           dtype=np.float32)  # (N, 4 corners, 2)
+            lefts = pts[:, :, 0].min(axis=1)
+            tops = pts[:, :, 1].min(axis=1)
+            widths = pts[:, :, 0].max(axis=1) - lefts
+            heights = pts[:, :, 1].max(axis=1) - tops
+            boxes = np.stack([lefts, tops, widths, heights], axis=1)
+        else:
+            boxes = np.empty((0, 4), dtype=np.float32)
+
+        print(f"Found {len(texts)} OCR results")
+
+        # Store compressed word list for the next run
+        session.merge(OCRWordCache(
+            pdf_hash=pdf_hash,
+            page_number=0,
+            dpi=OCR_DPI,
+            words_json=zlib.compress(json.dumps(
+                {'texts': texts, 'boxes': boxes.tolist()}).encode('utf-8'))
+        ))
+        session.commit()
+
+    texts_lower = [t.lower() for t in texts]
+
+    # Exact-match token index built once - O(1) anchor lookup for the common
+    # case where the search string equals an OCR token verbatim. The O(N)
+    # bidirectional substring scan only runs when the exact lookup misses.
+    token_to_index = {}
+    for i, t in enumerate(texts_lower):
+        token_to_index.setdefault(t, i)
+
+    # PASS 1: Find each label's anchor and collect the cropped value regions.
+    # Running OCR per-crop pays the CRAFT detector startup cost once per label,
+    # so we batch all crops into a single readtext_batched() call below.
+    crops = []        # np arrays of cropped value regions
+    crop_labels = []  # label names, parallel to crops
+
     for lb in label_boxes:
         anchors = [b for b in lb.children if b.box_type == 'anchor']
         values = [b for b in lb.children if b.box_type == 'value']
-        
+
         if not anchors or not values:
             continue
-        
+
         anchor = anchors[0]
         value = values[0]
-        
+
         anchor_search = anchor.anchor_text or ''
         if not anchor_search or anchor_search.startswith("Anchor:"):
             anchor_search = anchor.name.replace("Anchor: ", "").replace("...", "").strip()
-        
+
         print(f"\n=== Extracting: {lb.name} ===")
         print(f"Searching for anchor: '{anchor_search}'")
-        
-        # Search for anchor
-        found_anchor = None
+
+        # Search for anchor - exact token hit first, substring scan as fallback
         search_lower = anchor_search.lower().strip()
-        
-        for word in words:
-            word_lower = word['text'].lower()
-            if search_lower in word_lower or word_lower in search_lower:
-                found_anchor = word
-                print(f"FOUND anchor: '{word['text']}' at ({word['left']:.0f}, {word['top']:.0f})")
-                break
-        
-        if not found_anchor:
+        idx = token_to_index.get(search_lower)
+        if idx is None:
+            idx = next((i for i, t in enumerate(texts_lower)
+                        if search_lower in t or t in search_lower), None)
+
+        if idx is None:
             print("Anchor NOT FOUND!")
             continue
-        
-        # Calculate value rect
-        value_dx = value.x - anchor.x
-        value_dy = value.y - anchor.y
-        
-        value_x = found_anchor['left'] + value_dx
-        value_y = found_anchor['top'] + value_dy
-        value_w = value.width
-        value_h = value.height
-        
+
+        anchor_left = float(boxes[idx, 0])
+        anchor_top = float(boxes[idx, 1])
+        print(f"FOUND anchor: '{texts[idx]}' at ({anchor_left:.0f}, {anchor_top:.0f})")
+
+        # Calculate value rect - template coords are stored at TEMPLATE_DPI,
+        # so scale the offsets down to the rasterization DPI
+        value_dx = (value.x - anchor.x) * TEMPLATE_SCALE
+        value_dy = (value.y - anchor.y) * TEMPLATE_SCALE
+
+        value_x = anchor_left + value_dx
+        value_y = anchor_top + value_dy
+        value_w = value.width * TEMPLATE_SCALE
+        value_h = value.height * TEMPLATE_SCALE
+
         print(f"Value rect: ({value_x:.0f}, {value_y:.0f}, {value_w:.0f}x{value_h:.0f})")
-        
-        # CROP and run OCR on value region (THE FIX!)
+
+        # Vector PDFs: read the value straight off the text layer - a clip
+        # extraction costs microseconds vs seconds for the OCR crop (the
+        # same fast path debug_extraction.py uses)
+        if pdf_words:
+            px_to_pt = 72 / OCR_DPI
+            clip = fitz.Rect(value_x * px_to_pt, value_y * px_to_pt,
+                             (value_x + value_w) * px_to_pt,
+                             (value_y + value_h) * px_to_pt)
+            extracted_value = page.get_text("text", clip=clip).strip()
+            print(f"\n*** [{lb.name}] EXTRACTED VALUE: '{extracted_value}' ***")
+            continue
+
+        # CROP the value region (THE FIX!) - NumPy slice, no PIL crop copy
         x1 = max(0, int(value_x))
         y1 = max(0, int(value_y))
-        x2 = min(img.width, int(value_x + value_w))
-        y2 = min(img.height, int(value_y + value_h))
-        
+        x2 = min(pix.width, int(value_x + value_w))
+        y2 = min(pix.height, int(value_y + value_h))
+
         print(f"Cropping to: ({x1}, {y1}) - ({x2}, {y2})")
-        
+
         if x2 <= x1 or y2 <= y1:
             print("Invalid crop region!")
             continue
-        
-        cropped = img.crop((x1, y1, x2, y2))
-        cropped_array = np.array(cropped)
-        
-        print(f"Cropped image size: {cropped.width} x {cropped.height}")
-        
-        # Run OCR on cropped region
-        print("Running OCR on cropped value region...")
-        value_ocr = reader.readtext(cropped_array)
-        
-        value_texts = [text.strip() for bbox, text, conf in value_ocr if text.strip()]
-        extracted_value = " ".join(value_texts)
-        
-        print(f"\n*** EXTRACTED VALUE: '{extracted_value}' ***")
+
+        cropped = img_array[y1:y2, x1:x2]
+        print(f"Cropped image size: {cropped.shape[1]} x {cropped.shape[0]}")
+
+        crops.append(cropped)
+        crop_labels.append(lb.name)
+
+    # PASS 2: One batched OCR call for all value regions.
+    # readtext_batched needs same-size inputs, so letterbox each crop onto a
+    # white canvas at the max crop dimensions (white = page background).
+    if crops:
+        n_height = max(c.shape[0] for c in crops)
+        n_width = max(c.shape[1] for c in crops)
+
+        batch = []
+        for c in crops:
+            canvas = np.full((n_height, n_width, 3), 255, dtype=np.uint8)
+            canvas[:c.shape[0], :c.shape[1]] = c
+            batch.append(canvas)
+
+        print(f"\nRunning batched OCR on {len(batch)} value region(s) "
+              f"({n_width}x{n_height} each)...")
+        batch_results = reader.readtext_batched(
+            batch, n_width=n_width, n_height=n_height, batch_size=len(batch))
+
+        for label_name, value_ocr in zip(crop_labels, batch_results):
+            value_texts = [text.strip() for bbox, text, conf in value_ocr if text.strip()]
+            extracted_value = " ".join(value_texts)
+            print(f"\n*** [{label_name}] EXTRACTED VALUE: '{extracted_value}' ***")
     
     doc.close()
     session.close()
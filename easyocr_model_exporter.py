@@ -12,9 +12,11 @@ Usage:
 import os
 import sys
 import base64
+import hashlib
 import json
 import zipfile
-import io
+import tempfile
+from multiprocessing import Pool
 from pathlib import Path
 
 # EasyOCR model directory
@@ -23,6 +25,15 @@ EXPORT_DIR = Path(__file__).parent / "easyocr_models"
 MAX_CHUNK_SIZE = 40 * 1024 * 1024  # 40MB per file (under GitHub's 100MB limit)
 
 
+def file_sha256(path):
+    """Stream-hash a file so import can skip already-present models"""
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            h.update(block)
+    return h.hexdigest()
+
+
 def get_model_files():
     """Get list of EasyOCR model files"""
     if not EASYOCR_DIR.exists():
@@ -37,6 +48,58 @@ def get_model_files():
     return files
 
 
+def _export_one(path_str):
+    """Compress, chunk and hash a single model file (runs in a pool worker).
+
+    Module-level so multiprocessing can pickle it on Windows spawn.
+    Returns the file's manifest entry.
+    """
+    f = Path(path_str)
+    print(f"  Compressing {f.name}...")
+
+    # Write each zip to a temp file instead of an in-memory buffer -
+    # keeps peak memory flat regardless of archive size.
+    tmp = tempfile.NamedTemporaryFile(suffix=".zip", delete=False)
+    tmp_path = Path(tmp.name)
+    tmp.close()
+
+    try:
+        # Level-1 deflate: model weights are near-incompressible, so the
+        # default level 6 burns CPU for almost no extra ratio. Store .pth
+        # files outright - PyTorch checkpoints are already zip archives.
+        compress_type = zipfile.ZIP_STORED if f.suffix == '.pth' else zipfile.ZIP_DEFLATED
+        with zipfile.ZipFile(tmp_path, 'w', compress_type, compresslevel=1) as zf:
+            zf.write(f, f.name, compress_type=compress_type)
+
+        # Stream-encode the zip in 3-byte-aligned blocks so every block's
+        # base64 output is self-contained (no padding mid-stream).
+        read_size = MAX_CHUNK_SIZE * 3 // 4
+        num_chunks = 0
+
+        with open(tmp_path, 'rb') as src:
+            while True:
+                block = src.read(read_size)
+                if not block:
+                    break
+                num_chunks += 1
+                chunk_file = EXPORT_DIR / f"{f.stem}_part{num_chunks}.txt"
+                with open(chunk_file, 'wb') as out:
+                    out.write(base64.b64encode(block))
+
+                chunk_size = chunk_file.stat().st_size / (1024*1024)
+                print(f"    Created {chunk_file.name} ({chunk_size:.1f} MB)")
+    finally:
+        tmp_path.unlink(missing_ok=True)
+
+    return {
+        "name": f.name,
+        "stem": f.stem,
+        "sha256": file_sha256(f),
+        "size": f.stat().st_size,
+        "chunks": num_chunks
+    }
+
+
 def export_models():
     """Export EasyOCR models to multiple text files (base64 encoded, <95MB each)"""
     files = get_model_files()
@@ -53,58 +116,34 @@ def export_models():
     
     print(f"[INFO] Total size: {total_size / (1024*1024):.1f} MB")
     
-    # Create in-memory zip file
-    print("[INFO] Creating compressed archive...")
-    zip_buffer = io.BytesIO()
-    with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_DEFLATED) as zf:
-        for f in files:
-            print(f"  Compressing {f.name}...")
-            zf.write(f, f.name)
-    
-    # Encode to base64
-    print("[INFO] Encoding to base64...")
-    zip_data = zip_buffer.getvalue()
-    b64_data = base64.b64encode(zip_data).decode('ascii')
-    
     # Create export directory
     EXPORT_DIR.mkdir(exist_ok=True)
-    
-    # Split into chunks
-    num_chunks = (len(b64_data) + MAX_CHUNK_SIZE - 1) // MAX_CHUNK_SIZE
-    print(f"[INFO] Splitting into {num_chunks} file(s) (max 40MB each)...")
-    
-    for i in range(num_chunks):
-        start = i * MAX_CHUNK_SIZE
-        end = min((i + 1) * MAX_CHUNK_SIZE, len(b64_data))
-        chunk_data = b64_data[start:end]
-        
-        chunk_file = EXPORT_DIR / f"models_part{i+1}.txt"
-        with open(chunk_file, 'w') as f:
-            f.write(chunk_data)
-        
-        chunk_size = chunk_file.stat().st_size / (1024*1024)
-        print(f"  Created {chunk_file.name} ({chunk_size:.1f} MB)")
-    
+
+    # One archive + chunk set PER model file, with its SHA256 in the
+    # manifest - import can then skip any model already installed intact
+    # instead of decoding and extracting the whole bundle every time.
+    # Files are independent, so a worker pool compresses them in parallel
+    # (deflate is CPU-bound; speedup ~ min(nfiles, ncores)).
+    print(f"[INFO] Creating per-model archives ({min(len(files), os.cpu_count() or 1)} worker(s))...")
+    with Pool(min(len(files), os.cpu_count() or 1)) as pool:
+        manifest = pool.map(_export_one, [str(f) for f in files])
+    total_chunks = sum(entry["chunks"] for entry in manifest)
+
     # Write metadata file
     metadata = {
-        "format": "easyocr_offline_v2",
-        "files": [f.name for f in files],
+        "format": "easyocr_offline_v3",
+        "files": manifest,
         "total_size_mb": total_size / (1024 * 1024),
-        "compressed_size_mb": len(zip_data) / (1024 * 1024),
-        "num_chunks": num_chunks,
-        "chunk_pattern": "models_part{n}.txt"
+        "chunk_pattern": "{stem}_part{n}.txt"
     }
-    
+
     meta_file = EXPORT_DIR / "metadata.json"
     with open(meta_file, 'w') as f:
         json.dump(metadata, f, indent=2)
-    
+
     print(f"\n[SUCCESS] Models exported to: {EXPORT_DIR}")
-    print(f"[INFO] Created {num_chunks + 1} files:")
-    print(f"  - metadata.json")
-    for i in range(num_chunks):
-        print(f"  - models_part{i+1}.txt")
-    
+    print(f"[INFO] Created {total_chunks + 1} files (metadata.json + chunks)")
+
     print(f"\n[IMPORTANT] To use on offline workspace:")
     print(f"  1. Copy the entire '{EXPORT_DIR.name}' folder to target workspace")
     print(f"  2. Run: python easyocr_model_exporter.py import")
@@ -124,43 +163,58 @@ def import_models():
     with open(meta_file, 'r') as f:
         metadata = json.load(f)
     
-    if metadata.get("format") not in ["easyocr_offline_v1", "easyocr_offline_v2"]:
-        print("[ERROR] Invalid export format.")
+    if metadata.get("format") != "easyocr_offline_v3":
+        print("[ERROR] Unsupported export format - re-run export on the source machine.")
         return False
-    
+
     print(f"[INFO] Contains {len(metadata['files'])} model files:")
-    for name in metadata['files']:
-        print(f"  - {name}")
-    
-    # Read all chunks
-    num_chunks = metadata.get("num_chunks", 1)
-    print(f"[INFO] Reading {num_chunks} chunk file(s)...")
-    
-    b64_data = ""
-    for i in range(num_chunks):
-        chunk_file = EXPORT_DIR / f"models_part{i+1}.txt"
-        if not chunk_file.exists():
-            print(f"[ERROR] Missing chunk file: {chunk_file}")
-            return False
-        
-        print(f"  Reading {chunk_file.name}...")
-        with open(chunk_file, 'r') as f:
-            b64_data += f.read()
-    
+    for entry in metadata['files']:
+        print(f"  - {entry['name']}")
+
     # Create EasyOCR directory
     EASYOCR_DIR.mkdir(parents=True, exist_ok=True)
-    
-    # Decode and extract
-    print("[INFO] Decoding base64 data...")
-    zip_data = base64.b64decode(b64_data)
-    
-    print("[INFO] Extracting model files...")
-    with zipfile.ZipFile(io.BytesIO(zip_data), 'r') as zf:
-        for name in zf.namelist():
-            print(f"  Extracting {name}...")
-            zf.extract(name, EASYOCR_DIR)
-    
-    print(f"\n[SUCCESS] Models imported to: {EASYOCR_DIR}")
+
+    imported = 0
+    skipped = 0
+
+    for entry in metadata['files']:
+        target = EASYOCR_DIR / entry['name']
+
+        # Skip models already installed intact - typical re-imports after a
+        # partial transfer become near-zero-cost
+        if target.exists() and file_sha256(target) == entry['sha256']:
+            print(f"  Skipping {entry['name']} (already present, hash matches)")
+            skipped += 1
+            continue
+
+        # Decode chunk-by-chunk into a temp zip file - each chunk was encoded
+        # from a 3-byte-aligned block, so it decodes standalone. Avoids holding
+        # the concatenated base64 string and the zip bytes in memory at once.
+        print(f"  Decoding {entry['name']} ({entry['chunks']} chunk file(s))...")
+        tmp = tempfile.NamedTemporaryFile(suffix=".zip", delete=False)
+        tmp_path = Path(tmp.name)
+        tmp.close()
+
+        try:
+            with open(tmp_path, 'wb') as out:
+                for i in range(entry['chunks']):
+                    chunk_file = EXPORT_DIR / f"{entry['stem']}_part{i+1}.txt"
+                    if not chunk_file.exists():
+                        print(f"[ERROR] Missing chunk file: {chunk_file}")
+                        return False
+
+                    with open(chunk_file, 'rb') as f:
+                        out.write(base64.b64decode(f.read()))
+
+            print(f"  Extracting {entry['name']}...")
+            with zipfile.ZipFile(tmp_path, 'r') as zf:
+                zf.extract(entry['name'], EASYOCR_DIR)
+            imported += 1
+        finally:
+            tmp_path.unlink(missing_ok=True)
+
+    print(f"\n[SUCCESS] Models imported to: {EASYOCR_DIR} "
+          f"({imported} extracted, {skipped} skipped)")
     print("[INFO] EasyOCR is now ready to use offline!")
     return True
 
@@ -4,6 +4,7 @@ The text appears straight when viewed, but the page has internal rotation of 90
 Aspect ratio 4:5 (width:height when viewed correctly)
 """
 import fitz  # PyMuPDF
+import numpy as np
 
 def generate_rotated_test_pdf():
     # Create a new PDF document
@@ -73,26 +74,25 @@ def generate_rotated_test_pdf():
     # For 90° CCW rotation, we need to map visual coords to internal coords
     # Visual (vx, vy) -> Internal (vy, internal_height - vx)
     # And rotate text by 90° to appear straight
-    
-    for item in content:
-        if item[0] == "":
-            continue
+
+    # The mapping is an affine transform: internal = visual @ M.T + t with
+    # M = [[0, 1], [-1, 0]] (90° rotation) and t = (0, internal_height).
+    # Precompute it once and apply to all insertion points in one shot -
+    # for other rotation angles later, only M and t change.
+    items = [item for item in content if item[0]]
+    pts = np.array([(item[1], item[2]) for item in items], dtype=np.float32)
+    M = np.array([[0, 1], [-1, 0]], dtype=np.float32)
+    t = np.array([0, internal_height], dtype=np.float32)
+    internal = pts @ M.T + t
+
+    for item, (internal_x, internal_y) in zip(items, internal):
         text, visual_x, visual_y, fontsize, bold = item
-        
-        # Convert visual coordinates to internal coordinates
-        # For 90° CCW rotation: internal_x = visual_y, internal_y = internal_height - visual_x
-        internal_x = visual_y
-        internal_y = internal_height - visual_x
-        
+
         # Create insertion point
-        point = fitz.Point(internal_x, internal_y)
-        
-        # Create rotation matrix (90° CW to counter the page's 90° CCW rotation)
-        # This makes text appear horizontal when viewed
-        rotate_matrix = fitz.Matrix(90)
-        
+        point = fitz.Point(float(internal_x), float(internal_y))
+
         fontname = "helv" if not bold else "hebo"
-        
+
         # Insert text with rotation
         page.insert_text(
             point,
@@ -12,66 +12,172 @@ from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QPushButton,
                                QMessageBox, QGraphicsScene, QGraphicsView,
                                QGraphicsRectItem, QTabWidget, QMainWindow, QInputDialog,QApplication,
                                QRubberBand, QMenu, QCheckBox)
-from PySide6.QtCore import Qt, QPointF, QRectF, Signal, QThread, QPoint, QRect, QSize
-from PySide6.QtGui import QPixmap, QImage, QPen, QColor, QBrush, QPainter
-from sqlalchemy import create_engine, Column, Integer, String, Float, ForeignKey, Boolean, DateTime
+from PySide6.QtCore import Qt, QPointF, QRectF, Signal, QThread, QPoint, QRect, QSize, QTimer, QRunnable, QThreadPool, QObject, QAbstractListModel, QModelIndex
+from PySide6.QtGui import QPixmap, QImage, QPen, QColor, QBrush, QPainter, QRegion, QPixmapCache
+from sqlalchemy import create_engine, event, Column, Integer, String, Float, ForeignKey, Boolean, DateTime, LargeBinary, Index
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, relationship
 from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.triggers.cron import CronTrigger
 from apscheduler.triggers.interval import IntervalTrigger
 from apscheduler.triggers.date import DateTrigger
+import collections
+import functools
+import hashlib
+import logging
+from concurrent.futures import ThreadPoolExecutor
 import subprocess
 import uuid
 import pandas as pd
 import datetime
+import atexit
+import threading
 import win32com.client
 import pythoncom
 
+# Optional native PDF renderer - renders straight into a QImage, skipping
+# the pix.samples copy the fitz path needs. Viewing falls back to fitz
+# wherever QtPdf is missing.
+try:
+    from PySide6.QtPdf import QPdfDocument
+except ImportError:
+    QPdfDocument = None
+
+# Hot render/scroll handlers log through here instead of print() - lazy
+# %-formatting and the level check cost nothing when warnings are off,
+# while print formats and flushes to stderr on every call
+log = logging.getLogger(__name__)
+
+# "1, 3-5, 8"-style page lists: one scan yields numbers and ranges alike
+_RANGE_RE = re.compile(r'(\d+)(?:\s*-\s*(\d+))?')
+
+# Local aliases for the per-page geometry hot loops - skips the fitz
+# module attribute lookup on every Point/Rect construction
+_Point = fitz.Point
+_Rect = fitz.Rect
+
+# Header/footer styling lookups, built once at import instead of per
+# invocation
+_COLOR_MAP = {
+    "black": (0, 0, 0),
+    "red": (1, 0, 0),
+    "blue": (0, 0, 1),
+    "green": (0, 0.5, 0),
+    "gray": (0.5, 0.5, 0.5),
+}
+_ALIGN_MAP = {
+    "Center": fitz.TEXT_ALIGN_CENTER,
+    "Left": fitz.TEXT_ALIGN_LEFT,
+    "Right": fitz.TEXT_ALIGN_RIGHT,
+}
+
+
+@functools.lru_cache(maxsize=128)
+def _measured_width(text, fontname, fontsize):
+    """Exact text width from the font's real glyph metrics.
+
+    The old len(text) * size * 0.6 estimate overshoots for proportional
+    fonts, producing wider rects than needed; get_text_length reads the
+    built-in font's width table in C. Cached because header/footer runs
+    measure the same string for every page.
+    """
+    return fitz.get_text_length(text, fontname=fontname, fontsize=fontsize)
+
+# One stylesheet for all toolbar buttons, applied once on the module and
+# matched by object name - each create_btn used to carry its own copy,
+# so Qt re-parsed the same QSS for every button
+MODULE_TOOLBAR_QSS = """
+    QPushButton#moduleToolbarBtn {
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+            stop:0 #667EEA, stop:1 #764BA2);
+        color: white; border: none; padding: 10px 20px;
+        border-radius: 6px; font-size: 14px; font-weight: 500;
+    }
+    QPushButton#moduleToolbarBtn:hover { background: #764BA2; }
+    QPushButton#tabCloseBtn { background-color: #dc2626; color: white; }
+"""
+
+
 # ============================================================================
 # OFFICE CONVERTER
 # ============================================================================
 
 class OfficeConverter:
-    @staticmethod
-    def convert_to_pdf(input_path):
-        """Convert PPT/Excel/Word to PDF using win32com"""
+    # Cached COM Application objects, one per Office app. Dispatching a fresh
+    # PowerPoint/Excel/Word server costs seconds; keeping the instance alive
+    # amortizes that bootstrap across a whole batch of conversions.
+    _apps = {}
+    _com_state = threading.local()
+
+    @classmethod
+    def _get_app(cls, prog_id):
+        """Return a cached Office Application object, creating it on first use"""
+        if not getattr(cls._com_state, 'initialized', False):
+            pythoncom.CoInitialize()
+            cls._com_state.initialized = True
+
+        app = cls._apps.get(prog_id)
+        if app is None:
+            app = win32com.client.Dispatch(prog_id)
+            cls._apps[prog_id] = app
+        return app
+
+    @classmethod
+    def _quit_apps(cls):
+        """Shut down any cached Office instances at process exit"""
+        for app in cls._apps.values():
+            try:
+                app.Quit()
+            except Exception:
+                pass
+        cls._apps.clear()
+
+    @classmethod
+    def convert_to_pdf(cls, input_path, out_path=None):
+        """Convert PPT/Excel/Word to PDF using win32com.
+
+        With out_path the Office app writes the PDF straight to its final
+        location - no post-conversion copy/move of the file.
+        """
         input_path = os.path.abspath(input_path)
         base, ext = os.path.splitext(input_path)
-        output_path = base + "_converted.pdf"
-        
+        output_path = os.path.abspath(out_path) if out_path else base + "_converted.pdf"
+
         try:
-            pythoncom.CoInitialize()
             ext = ext.lower()
-            
+
             if ext in ['.pptx', '.ppt']:
-                powerpoint = win32com.client.Dispatch("Powerpoint.Application")
+                powerpoint = cls._get_app("Powerpoint.Application")
                 presentation = powerpoint.Presentations.Open(input_path, WithWindow=False)
                 presentation.SaveAs(output_path, 32) # 32 = ppSaveAsPDF
                 presentation.Close()
-                # powerpoint.Quit() # Keep open for performance?
-                
+                # App stays open - quit at process exit
+
             elif ext in ['.xlsx', '.xls']:
-                excel = win32com.client.Dispatch("Excel.Application")
+                excel = cls._get_app("Excel.Application")
                 excel.Visible = False
                 wb = excel.Workbooks.Open(input_path)
                 wb.ExportAsFixedFormat(0, output_path) # 0 = xlTypePDF
                 wb.Close(False)
-                # excel.Quit()
-                
+
             elif ext in ['.docx', '.doc']:
-                word = win32com.client.Dispatch("Word.Application")
+                word = cls._get_app("Word.Application")
                 word.Visible = False
                 doc = word.Documents.Open(input_path)
                 doc.SaveAs(output_path, 17) # 17 = wdFormatPDF
                 doc.Close()
-                # word.Quit()
-                
+
             return output_path
         except Exception as e:
             print(f"Conversion failed: {e}")
+            # A dead COM server would poison every later call - drop the cache
+            cls._apps.pop({'.pptx': "Powerpoint.Application", '.ppt': "Powerpoint.Application",
+                           '.xlsx': "Excel.Application", '.xls': "Excel.Application",
+                           '.docx': "Word.Application", '.doc': "Word.Application"}.get(ext), None)
             return None
 
+atexit.register(OfficeConverter._quit_apps)
+
 # ============================================================================
 # DATABASE SETUP
 # ============================================================================
@@ -80,6 +186,18 @@ Base = declarative_base()
 DB_PATH = "data/automation_hub.db"
 os.makedirs("data", exist_ok=True)
 engine = create_engine(f"sqlite:///{DB_PATH}")
+
+@event.listens_for(engine, "connect")
+def _set_sqlite_pragmas(dbapi_conn, connection_record):
+    """Speed up SQLite reads/writes (WAL + bigger page cache)"""
+    cursor = dbapi_conn.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA cache_size=-65536")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA mmap_size=268435456")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.close()
+
 SessionLocal = sessionmaker(bind=engine)
 
 class Template(Base):
@@ -141,16 +259,39 @@ class LabeledBox(Base):
     height = Column(Float)
     anchor_text = Column(String, nullable=True)  # OCR-captured text for anchor boxes
     page = relationship("OCRPage", back_populates="boxes")
-    # Self-referential relationship: parent has many children
-    children = relationship("LabeledBox", 
+    # Self-referential relationship: parent has many children.
+    # selectin loads them in one follow-up IN-clause query instead of the
+    # outer self-join (and Python-side row dedup) that lazy="joined" forces
+    # onto every LabeledBox query.
+    children = relationship("LabeledBox",
                            foreign_keys="LabeledBox.parent_box_id",
                            back_populates="parent_box",
-                           lazy="joined")
+                           lazy="selectin")
     parent_box = relationship("LabeledBox", 
                              remote_side="LabeledBox.id",
                              foreign_keys="LabeledBox.parent_box_id",
                              back_populates="children")
 
+# Extraction filters on (page_id, box_type) and the children self-join keys
+# on parent_box_id - without these SQLite scans the whole table per query
+Index('ix_labeled_boxes_page_type', LabeledBox.page_id, LabeledBox.box_type)
+Index('ix_labeled_boxes_parent', LabeledBox.parent_box_id)
+
+
+class OCRWordCache(Base):
+    """Cached full-page OCR word lists, keyed by PDF content hash.
+
+    Lets repeated extractions on unchanged PDFs skip the (expensive)
+    EasyOCR pass entirely. words_json holds the zlib-compressed JSON
+    word list as produced by the extraction scripts.
+    """
+    __tablename__ = "ocr_word_cache"
+    pdf_hash = Column(String, primary_key=True)     # sha256 of the PDF bytes
+    page_number = Column(Integer, primary_key=True)
+    dpi = Column(Integer, primary_key=True)
+    words_json = Column(LargeBinary)
+    created_at = Column(DateTime, default=datetime.datetime.utcnow)
+
 
 class Job(Base):
     __tablename__ = "jobs"
@@ -189,6 +330,15 @@ def run_migrations():
                 conn.commit()
                 print("[DB Migration] Added anchor_text column to labeled_boxes")
 
+        # Backfill query indexes on databases created before they existed
+        # (create_all only builds indexes alongside new tables)
+        with engine.connect() as conn:
+            conn.execute(text("CREATE INDEX IF NOT EXISTS ix_labeled_boxes_page_type "
+                              "ON labeled_boxes (page_id, box_type)"))
+            conn.execute(text("CREATE INDEX IF NOT EXISTS ix_labeled_boxes_parent "
+                              "ON labeled_boxes (parent_box_id)"))
+            conn.commit()
+
 try:
     run_migrations()
 except Exception as e:
@@ -198,158 +348,415 @@ except Exception as e:
 # UTILITY CLASSES
 # ============================================================================
 
+# Shared "no selection" sentinel - clearing reuses this instead of building
+# fresh null QRects, and identity tests short-circuit before isNull().
+# Never mutated: every drag path assigns a brand-new rect before moving it.
+_NULL_RECT = QRect()
+
+
+class _PixmapScaleJob(QRunnable):
+    """Scales a page image off the GUI thread for PDFCanvas.setPixmapAsync.
+
+    Works on a QImage - QPixmaps must not be touched outside the GUI
+    thread - and reports back through the canvas signal.
+    """
+    def __init__(self, canvas, image, target_size, generation):
+        super().__init__()
+        self.canvas = canvas
+        self.image = image
+        self.target_size = target_size
+        self.generation = generation
+
+    def run(self):
+        scaled = self.image.scaled(self.target_size, Qt.KeepAspectRatio,
+                                   Qt.SmoothTransformation)
+        self.canvas._pixmap_scaled.emit(scaled, self.generation)
+
+
 class PDFCanvas(QLabel):
     """Custom label that supports interactive selection with resize handles"""
     selection_confirmed = Signal(QRect)
+    _pixmap_scaled = Signal(QImage, int)
 
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setMouseTracking(True)  # Improve responsiveness
+        # We repaint every exposed pixel ourselves (pixmap + margin fill in
+        # paintEvent), so Qt can skip its per-repaint background pass
+        self.setAttribute(Qt.WA_OpaquePaintEvent, True)
+        self.setAttribute(Qt.WA_NoSystemBackground, True)
         self.selection_mode = False
         
         # State
-        self.current_rect = QRect()
+        self.current_rect = _NULL_RECT
         self.drag_start = QPoint()
         self.drag_mode = None  # None, 'create', 'move', 'handle'
         self.active_handle = None
-        
+        self._active_mask = 0  # Edge bitmask for the handle being dragged
+        # Bound at drag start to the branch for the active mode, so the
+        # flush path runs without re-dispatching on drag_mode each sample
+        self._apply_move = None
+
+        # Handle rect cache - rebuilt only when the selection geometry changes
+        self._handle_cache = None
+        self._handle_cache_key = None
+
+        # Coalesce drag updates to ~display cadence - mice report at up to
+        # 1000 Hz and each sample would otherwise run the full geometry +
+        # repaint path
+        self._pending_pos = None
+        self._move_timer = QTimer(self)
+        self._move_timer.setSingleShot(True)
+        self._move_timer.setInterval(16)  # ~60 Hz
+        self._move_timer.timeout.connect(self._flush_move)
+
+        # Last cursor shape applied - setCursor crosses the display-server
+        # boundary on X11/Wayland, so skip it when nothing changed
+        self._last_cursor = None
+
+        # Async scaling: generation counter drops results from superseded
+        # zoom requests (queued signal delivers on the GUI thread)
+        self._scale_generation = 0
+        self._pixmap_scaled.connect(self._on_pixmap_scaled)
+
         # Appearance
         self.handle_size = 8
         self.border_color = QColor(255, 0, 0)
         self.fill_color = QColor(255, 0, 0, 50)
         self.handle_color = QColor(255, 255, 255)
 
+        # Pens/brushes built once - paintEvent runs at refresh rate during
+        # a drag and doesn't need 4 fresh allocations per frame
+        self._border_pen_2 = QPen(self.border_color, 2)
+        self._border_pen_1 = QPen(self.border_color, 1)
+        self._fill_brush = QBrush(self.fill_color)
+        self._handle_brush = QBrush(self.handle_color)
+
+    def setPixmapAsync(self, source_pixmap, target_size):
+        """Scale source_pixmap to target_size on a pool thread and swap it
+        in when done - the old pixmap stays visible, so a smooth-transform
+        zoom never stalls the paint/drag path"""
+        self._scale_generation += 1
+        job = _PixmapScaleJob(self, source_pixmap.toImage(), target_size,
+                              self._scale_generation)
+        QThreadPool.globalInstance().start(job)
+
+    def _on_pixmap_scaled(self, image, generation):
+        if generation == self._scale_generation:
+            self.setPixmap(QPixmap.fromImage(image))
+
+    def _set_cursor(self, shape):
+        if shape != self._last_cursor:
+            self._last_cursor = shape
+            self.setCursor(shape)
+
     def set_selection_mode(self, enabled):
         self.selection_mode = enabled
         if enabled:
-            self.setCursor(Qt.CrossCursor)
+            self._set_cursor(Qt.CrossCursor)
             self.setFocus()
         else:
-            self.setCursor(Qt.ArrowCursor)
-            self.current_rect = QRect() # Clear selection
+            self._set_cursor(Qt.ArrowCursor)
+            old_rect = self.current_rect
+            self.current_rect = _NULL_RECT # Clear selection
+            self._update_selection(old_rect)
+
+    def _update_selection(self, *rects):
+        """Repaint only the area covered by the given rect(s) plus the
+        handle/pen overhang - a drag then invalidates a thin band instead
+        of the whole page pixmap"""
+        m = self.handle_size
+        dirty = QRect()
+        for r in rects:
+            if not r.isNull():
+                dirty = dirty.united(r.adjusted(-m, -m, m, m))
+        if dirty.isNull():
             self.update()
+        else:
+            self.update(dirty)
+
+    def _update_handle_drag(self, old_rect, new_rect):
+        """Dirty region for an edge resize: the strip each moved edge swept
+        plus thin perimeter bands (midpoint handles slide along unmoved
+        edges when the size changes) - far less than the full bbox for
+        large selections"""
+        m = self.handle_size
+        T = min(old_rect.top(), new_rect.top()) - m
+        B = max(old_rect.bottom(), new_rect.bottom()) + m
+        L = min(old_rect.left(), new_rect.left()) - m
+        R = max(old_rect.right(), new_rect.right()) + m
+
+        region = QRegion()
+        if old_rect.left() != new_rect.left():
+            a, b = sorted((old_rect.left(), new_rect.left()))
+            region = region.united(QRect(a - m, T, b - a + 2 * m, B - T + 1))
+        if old_rect.right() != new_rect.right():
+            a, b = sorted((old_rect.right(), new_rect.right()))
+            region = region.united(QRect(a - m, T, b - a + 2 * m, B - T + 1))
+        if old_rect.top() != new_rect.top():
+            a, b = sorted((old_rect.top(), new_rect.top()))
+            region = region.united(QRect(L, a - m, R - L + 1, b - a + 2 * m))
+        if old_rect.bottom() != new_rect.bottom():
+            a, b = sorted((old_rect.bottom(), new_rect.bottom()))
+            region = region.united(QRect(L, a - m, R - L + 1, b - a + 2 * m))
+
+        # Perimeter bands covering the sliding midpoint/corner handles
+        region = region.united(QRect(L, T, R - L + 1, 2 * m))
+        region = region.united(QRect(L, B - 2 * m + 1, R - L + 1, 2 * m))
+        region = region.united(QRect(L, T, 2 * m, B - T + 1))
+        region = region.united(QRect(R - 2 * m + 1, T, 2 * m, B - T + 1))
+        self.update(region)
 
     def paintEvent(self, event):
+        # Opaque widget: fill the margins the (centered) pixmap doesn't
+        # cover, since Qt no longer clears the background for us
+        pm = self.pixmap()
+        if pm is None or pm.isNull() or pm.size() != self.size():
+            painter = QPainter(self)
+            painter.fillRect(event.rect(), self.palette().window())
+            painter.end()
+
         super().paintEvent(event) # Draw the pixmap
-        
-        if self.selection_mode and not self.current_rect.isNull():
+
+        if (self.selection_mode and self.current_rect is not _NULL_RECT
+                and not self.current_rect.isNull()):
+            s = self.handle_size
+            # Exposed region doesn't touch the selection (scroll/partial
+            # expose, window moves) - the pixmap blit above is all that's
+            # needed and no QPainter gets constructed at all
+            if not event.rect().intersects(self.current_rect.adjusted(-s, -s, s, s)):
+                return
             painter = QPainter(self)
-            painter.setPen(QPen(self.border_color, 2))
-            painter.setBrush(QBrush(self.fill_color))
-            
+            painter.setClipRegion(event.region())  # Only touch exposed pixels
+            painter.setPen(self._border_pen_2)
+            painter.setBrush(self._fill_brush)
+
             # Draw Main Rect
             painter.drawRect(self.current_rect)
-            
-            # Draw Handles
-            painter.setBrush(QBrush(self.handle_color))
-            painter.setPen(QPen(self.border_color, 1))
-            for handle_rect in self._get_handles().values():
-                painter.drawRect(handle_rect)
+
+            # Draw Handles - one drawRects call instead of 8 binding
+            # crossings. Skipped mid-create and for selections too small for
+            # the handle grid, where the 8 handles would overlap into a blob.
+            r = self.current_rect
+            if (self.drag_mode != 'create'
+                    and r.width() > 3 * s and r.height() > 3 * s):
+                painter.setBrush(self._handle_brush)
+                painter.setPen(self._border_pen_1)
+                painter.drawRects([rect for _, rect in self._get_handles()])
 
     def _get_handles(self):
-        """Calculate handle rectangles for current selection"""
-        if self.current_rect.isNull(): return {}
-        
+        """Calculate handle rectangles for current selection.
+
+        Pure function of (rect, handle_size), so the 8 QRects are memoized -
+        both paintEvent and hover hit-testing call this per mouse event.
+        """
+        if self.current_rect is _NULL_RECT or self.current_rect.isNull():
+            return []
+
         r = self.current_rect
         s = self.handle_size
+        key = (r.x(), r.y(), r.width(), r.height(), s)
+        if key == self._handle_cache_key:
+            return self._handle_cache
+
         hs = s // 2
-        
-        handles = {
-            'tl': QRect(r.left() - hs, r.top() - hs, s, s),
-            't':  QRect(r.center().x() - hs, r.top() - hs, s, s),
-            'tr': QRect(r.right() - hs, r.top() - hs, s, s),
-            'r':  QRect(r.right() - hs, r.center().y() - hs, s, s),
-            'br': QRect(r.right() - hs, r.bottom() - hs, s, s),
-            'b':  QRect(r.center().x() - hs, r.bottom() - hs, s, s),
-            'bl': QRect(r.left() - hs, r.bottom() - hs, s, s),
-            'l':  QRect(r.left() - hs, r.center().y() - hs, s, s),
-        }
+        handles = [
+            ('tl', QRect(r.left() - hs, r.top() - hs, s, s)),
+            ('t',  QRect(r.center().x() - hs, r.top() - hs, s, s)),
+            ('tr', QRect(r.right() - hs, r.top() - hs, s, s)),
+            ('r',  QRect(r.right() - hs, r.center().y() - hs, s, s)),
+            ('br', QRect(r.right() - hs, r.bottom() - hs, s, s)),
+            ('b',  QRect(r.center().x() - hs, r.bottom() - hs, s, s)),
+            ('bl', QRect(r.left() - hs, r.bottom() - hs, s, s)),
+            ('l',  QRect(r.left() - hs, r.center().y() - hs, s, s)),
+        ]
+        self._handle_cache = handles
+        self._handle_cache_key = key
         return handles
 
+    # 3x3 zone table indexed [row][col]; the centre cell is not a handle
+    _HANDLE_ZONES = [['tl', 't', 'tr'],
+                     ['l', None, 'r'],
+                     ['bl', 'b', 'br']]
+
+    # Edge bitmask per handle (L=1, R=2, T=4, B=8) - resize tests become
+    # native int ANDs instead of substring scans per sample
+    _HANDLE_MASK = {'l': 1, 'r': 2, 't': 4, 'b': 8,
+                    'tl': 5, 'tr': 6, 'bl': 9, 'br': 10}
+
+    # Hover cursor per handle - one dict lookup instead of an if/elif
+    # chain with repeated Qt attribute lookups per mouse sample
+    _HANDLE_CURSORS = {'tl': Qt.SizeFDiagCursor, 'br': Qt.SizeFDiagCursor,
+                       'tr': Qt.SizeBDiagCursor, 'bl': Qt.SizeBDiagCursor,
+                       'l': Qt.SizeHorCursor, 'r': Qt.SizeHorCursor,
+                       't': Qt.SizeVerCursor, 'b': Qt.SizeVerCursor}
+
     def _get_handle_at(self, pos):
-        for name, rect in self._get_handles().items():
-            if rect.contains(pos):
-                return name
-        return None
+        """Classify pos against the selection's edge coordinates - a handful
+        of integer comparisons and one table index instead of 8 QRect
+        contains() calls on every mouse move"""
+        r = self.current_rect
+        if r.isNull():
+            return None
+
+        x, y = pos.x(), pos.y()
+        hs = self.handle_size // 2
+        L, R, T, B = r.left(), r.right(), r.top(), r.bottom()
+
+        # Outside the rect band (plus handle overhang) - no handle can match
+        if not (L - hs <= x <= R + hs and T - hs <= y <= B + hs):
+            return None
+
+        col = (0 if abs(x - L) <= hs else
+               2 if abs(x - R) <= hs else
+               1 if abs(x - r.center().x()) <= hs else -1)
+        row = (0 if abs(y - T) <= hs else
+               2 if abs(y - B) <= hs else
+               1 if abs(y - r.center().y()) <= hs else -1)
+
+        if col < 0 or row < 0:
+            return None
+        return self._HANDLE_ZONES[row][col]
 
     def mousePressEvent(self, event):
         if not self.selection_mode or event.button() != Qt.LeftButton:
             return
             
-        pos = event.position().toPoint()
-        
+        # One float->int conversion at entry; everything below wants ints
+        p = event.position()
+        pos = QPoint(int(p.x()), int(p.y()))
+
         # Check handles first
         handle = self._get_handle_at(pos)
         if handle:
             self.drag_mode = 'handle'
             self.active_handle = handle
+            self._active_mask = self._HANDLE_MASK[handle]
             self.drag_start = pos
+            self._apply_move = self._apply_resize
             return
-            
+
         # Check move
         if self.current_rect.contains(pos):
             self.drag_mode = 'move'
             self.drag_start = pos
-            self.setCursor(Qt.SizeAllCursor)
+            self._apply_move = self._apply_translate
+            self._set_cursor(Qt.SizeAllCursor)
             return
-            
+
         # Create new
         self.drag_mode = 'create'
         self.drag_start = pos
+        self._apply_move = self._apply_create
+        old_rect = self.current_rect
         self.current_rect = QRect(pos, QSize())
-        self.update()
+        self._update_selection(old_rect)
 
     def mouseMoveEvent(self, event):
         if not self.selection_mode: return
 
-        pos = event.position().toPoint()
-        
+        p = event.position()
+        pos = QPoint(int(p.x()), int(p.y()))
+
         # Update cursor hover feedback
         if not self.drag_mode:
+            # Cursor far from the selection (the common case while roaming
+            # the page) - no handle can match, skip the hit-test entirely.
+            # Plain int compares; no adjusted() rect is allocated per sample.
+            s = self.handle_size
+            r = self.current_rect
+            x, y = pos.x(), pos.y()
+            if (x < r.left() - s or x > r.right() + s
+                    or y < r.top() - s or y > r.bottom() + s):
+                self._set_cursor(Qt.CrossCursor)
+                return
             handle = self._get_handle_at(pos)
             if handle:
-                if handle in ['tl', 'br']: self.setCursor(Qt.SizeFDiagCursor)
-                elif handle in ['tr', 'bl']: self.setCursor(Qt.SizeBDiagCursor)
-                elif handle in ['l', 'r']: self.setCursor(Qt.SizeHorCursor)
-                elif handle in ['t', 'b']: self.setCursor(Qt.SizeVerCursor)
+                self._set_cursor(self._HANDLE_CURSORS[handle])
             elif self.current_rect.contains(pos):
-                self.setCursor(Qt.SizeAllCursor)
+                self._set_cursor(Qt.SizeAllCursor)
             else:
-                self.setCursor(Qt.CrossCursor)
+                self._set_cursor(Qt.CrossCursor)
+            return
+
+        # Queue the latest position; geometry work happens in _flush_move
+        # at timer cadence no matter how fast the mouse reports
+        self._pending_pos = pos
+        if not self._move_timer.isActive():
+            self._move_timer.start()
+
+    def _flush_move(self):
+        """Apply the most recent drag position (coalesced mouse samples)
+        via the handler bound for the active drag mode"""
+        if self._apply_move is None or self._pending_pos is None:
             return
+        pos = self._pending_pos
+        self._pending_pos = None
+        self._apply_move(pos)
+
+    # Edge math on plain ints - one QRect is built per flush instead of
+    # the QRect(...).normalized() pairs the old branches allocated
+
+    def _apply_create(self, pos):
+        sx, sy = self.drag_start.x(), self.drag_start.y()
+        px, py = pos.x(), pos.y()
+        L, R = (sx, px) if sx <= px else (px, sx)
+        T, B = (sy, py) if sy <= py else (py, sy)
+        old_rect = self.current_rect
+        self.current_rect = QRect(L, T, R - L + 1, B - T + 1)
+        self._update_selection(old_rect, self.current_rect)
 
-        # Handle Dragging
+    def _apply_translate(self, pos):
+        old_rect = QRect(self.current_rect)
+        self.current_rect.translate(pos.x() - self.drag_start.x(),
+                                    pos.y() - self.drag_start.y())
+        self.drag_start = pos
+
+        # Shape unchanged, only position - repaint the exposed strips:
+        # union of both expanded bboxes minus the shared interior, whose
+        # uniform fill pixels are identical before and after. The interior
+        # is shrunk by the handle/pen margin so old border/handle pixels
+        # along its rim still get repainted.
+        s = self.handle_size
+        overlap = old_rect.intersected(self.current_rect).adjusted(s, s, -s, -s)
+        dirty = (QRegion(old_rect.adjusted(-s, -s, s, s))
+                 .united(QRegion(self.current_rect.adjusted(-s, -s, s, s))))
+        if overlap.isValid():
+            dirty = dirty.subtracted(QRegion(overlap))
+        self.update(dirty)
+
+    def _apply_resize(self, pos):
         dx = pos.x() - self.drag_start.x()
         dy = pos.y() - self.drag_start.y()
-        
-        if self.drag_mode == 'create':
-            self.current_rect = QRect(self.drag_start, pos).normalized()
-            
-        elif self.drag_mode == 'move':
-            self.current_rect.translate(dx, dy)
-            self.drag_start = pos
-            
-        elif self.drag_mode == 'handle':
-            r = self.current_rect
-            # Adjust specific edges based on handle
-            if 'l' in self.active_handle: r.setLeft(r.left() + dx)
-            if 'r' in self.active_handle: r.setRight(r.right() + dx)
-            if 't' in self.active_handle: r.setTop(r.top() + dy)
-            if 'b' in self.active_handle: r.setBottom(r.bottom() + dy)
-            self.current_rect = r.normalized()
-            self.drag_start = pos
-            
-        self.update()
+        r = self.current_rect
+        L, R, T, B = r.left(), r.right(), r.top(), r.bottom()
+        # Adjust specific edges based on handle
+        m = self._active_mask
+        if m & 1: L += dx
+        if m & 2: R += dx
+        if m & 4: T += dy
+        if m & 8: B += dy
+        if L > R: L, R = R, L
+        if T > B: T, B = B, T
+        old_rect = self.current_rect
+        self.current_rect = QRect(L, T, R - L + 1, B - T + 1)
+        self.drag_start = pos
+        self._update_handle_drag(old_rect, self.current_rect)
 
     def mouseReleaseEvent(self, event):
         if self.selection_mode and event.button() == Qt.LeftButton:
+            self._flush_move()  # Apply any queued drag sample first
+            self._move_timer.stop()
             self.drag_mode = None
+            self._apply_move = None
             self.active_handle = None
-            self.update() # Refreshes handles position
-            
+            self._update_selection(self.current_rect) # Refreshes handles position
+
             # Ensure 0-size rects are ignored but don't finish yet
             if self.current_rect.width()<5 and self.current_rect.height()<5:
-                self.current_rect = QRect()
+                old_rect = self.current_rect
+                self.current_rect = _NULL_RECT
+                self._update_selection(old_rect)
                 
     def keyPressEvent(self, event):
         if not self.selection_mode:
@@ -360,7 +767,7 @@ class PDFCanvas(QLabel):
             if not self.current_rect.isNull():
                 self.selection_confirmed.emit(self.current_rect)
         elif event.key() == Qt.Key_Escape:
-            self.current_rect = QRect()
+            self.current_rect = _NULL_RECT
             self.update()
             # Optionally exit mode? For now just clear selection
 
@@ -368,8 +775,57 @@ class PDFCanvas(QLabel):
 # PDF EDITOR MODULE
 # ============================================================================
 
+class _PrefetchSignals(QObject):
+    """Carries finished background renders back to the GUI thread"""
+    done = Signal(int, float, object, int, int, int)  # page, scale, samples, w, h, stride
+
+
+class _PageRenderJob(QRunnable):
+    """Renders one page off the GUI thread to warm the PDFTab pixmap LRU"""
+    def __init__(self, tab, page_no, scale):
+        super().__init__()
+        self.tab = tab
+        self.page_no = page_no
+        self.scale = scale
+
+    def run(self):
+        tab = self.tab
+        pix = None
+        try:
+            # MuPDF documents aren't thread-safe - serialize against the
+            # GUI thread's own renders on the tab's doc lock
+            with tab._doc_lock:
+                if tab.doc:
+                    page = tab.doc.load_page(self.page_no)
+                    # alpha=False: MuPDF only paints the page background
+                    # white for opaque pixmaps, and the canvas composites
+                    # over whatever is behind it (WA_OpaquePaintEvent)
+                    pix = page.get_pixmap(
+                        matrix=fitz.Matrix(self.scale, self.scale))
+        except Exception as e:
+            log.warning("Prefetch render error: %s", e)
+        # Always emit, with a null pixmap on failure - the handler must
+        # drop (page, scale) from _prefetching either way, or the page is
+        # blacklisted from prefetching for the rest of the session.
+        # Emitting the Pixmap itself on success - bytes(pix.samples) would
+        # duplicate the multi-MB frame just to cross the signal boundary
+        if pix is None:
+            tab._prefetch_signals.done.emit(
+                self.page_no, self.scale, None, 0, 0, 0)
+        else:
+            tab._prefetch_signals.done.emit(
+                self.page_no, self.scale,
+                pix, pix.width, pix.height, pix.stride)
+
+
 class PDFTab(QWidget):
-    def __init__(self, doc, path=None, is_temp=False, temp_path=None):
+    # Above this zoom, raster only visible 512-px tiles instead of the
+    # whole page
+    _TILE_SCALE_THRESHOLD = 3.0
+    _TILE_PX = 512
+
+    def __init__(self, doc, path=None, is_temp=False, temp_path=None,
+                 initial_cache=None):
         super().__init__()
         self.doc = doc
         self.path = path
@@ -378,17 +834,101 @@ class PDFTab(QWidget):
         self.is_temp = is_temp
         self.temp_path = temp_path
         self.parent_dock = None  # Will be set by PDFEditorModule
+        self._module = None  # Owning PDFEditorModule, resolved lazily once
+
+        # Page count and page sizes cross the MuPDF FFI boundary on every
+        # lookup - cache them; refresh() re-reads after doc mutations
+        self._page_count = len(doc) if doc else 0
+        self._page_sizes = {}
+        self._has_rotation = None  # lazily scanned, reset on mutation
+
+        # Annotation tags written by the header/footer and page-number
+        # tools this session - lets removal match titles by set lookup
+        self.tool_annot_tags = set()
+
+        # Bumped by refresh() on every document mutation; caches keyed on
+        # the doc (like the module's rasterized-JPEG LRU) include this so
+        # pre-edit entries can never be served for an edited page
+        self._doc_generation = 0
+
+        # QtPdf sidecar renderer for docs opened from disk - fitz stays the
+        # editing engine, but plain viewing renders without the extra
+        # samples-buffer copy. Dropped on refresh(): once the fitz doc is
+        # mutated the on-disk file QtPdf reads is stale.
+        self._qpdf = None
+        # Only when the fitz doc was really opened from this file - merged/
+        # split tabs carry placeholder paths ("Merged.pdf"), and a same-named
+        # file on disk would render the wrong document
+        if (QPdfDocument is not None and path and
+                doc is not None and doc.name == path and
+                os.path.exists(path)):
+            try:
+                qpdf = QPdfDocument()
+                qpdf.load(path)
+                if qpdf.pageCount() > 0:
+                    self._qpdf = qpdf
+            except Exception as e:
+                log.warning("QtPdf load failed: %s", e)
+
+        # Rendered-page LRU keyed by (page, scale). Bounded by pixel bytes,
+        # not entry count, so a few 400%-zoom pages can't blow up memory.
+        # Revisiting a cached page skips the MuPDF raster entirely.
+        # initial_cache seeds it from another tab whose pages look the
+        # same (QPixmaps are reference-counted, so the copy is shallow).
+        self._pix_cache = collections.OrderedDict(initial_cache or ())
+        self._pix_cache_bytes = sum(n for _, n in self._pix_cache.values())
+        self._pix_cache_limit = 256 * 1024 * 1024
+
+        # Background prefetch of neighbouring pages into the LRU
+        self._doc_lock = threading.Lock()
+        self._prefetching = set()
+        self._prefetch_signals = _PrefetchSignals()
+        self._prefetch_signals.done.connect(self._on_prefetch_done)
+
+        # (page, scale) of the last completed render - resize storms call
+        # the fit handlers repeatedly with the scale snapping to the same
+        # value, and re-rendering those is pure waste
+        self._last_rendered = None
+
+        # Debounce zoom bursts - three fast clicks used to raster the page
+        # three times with only the last result ever shown
+        self._zoom_timer = QTimer(self)
+        self._zoom_timer.setSingleShot(True)
+        self._zoom_timer.setInterval(80)
+        self._zoom_timer.timeout.connect(self.render)
+
+        # At high zoom only the visible part of the page is rastered
+        # (512-px tiles into a page-sized backing pixmap); scrolling fills
+        # missing tiles once the scrollbars settle for 50 ms
+        self._tiles_done = set()
+        self._scroll_timer = QTimer(self)
+        self._scroll_timer.setSingleShot(True)
+        self._scroll_timer.setInterval(50)
+        self._scroll_timer.timeout.connect(self._render_visible_tiles)
+
+        # Coalesces redraws requested by document mutations (see
+        # schedule_render)
+        self._render_pending = False
+
         self.setup_ui()
         self.setFocusPolicy(Qt.ClickFocus)
 
+    def _find_module(self):
+        """Owning PDFEditorModule - the parent-chain walk runs once, then
+        every later lookup (focus events fire per click) is a field read"""
+        if self._module is None:
+            parent = self.parent()
+            while parent and not isinstance(parent, PDFEditorModule):
+                parent = parent.parent()
+            self._module = parent
+        return self._module
+
     def focusInEvent(self, event):
         super().focusInEvent(event)
         # Notify parent PDFEditorModule that this tab is active
-        parent = self.parent()
-        while parent and not isinstance(parent, PDFEditorModule):
-            parent = parent.parent()
-        if parent:
-            parent._last_active_tab = self
+        module = self._find_module()
+        if module:
+            module._last_active_tab = self
 
     def mousePressEvent(self, event):
         self.setFocus()
@@ -454,7 +994,7 @@ class PDFTab(QWidget):
         self.btn_close = QPushButton("✖")
         self.btn_close.setFixedSize(40, 30)
         self.btn_close.clicked.connect(self.close_self)
-        self.btn_close.setStyleSheet("background-color: #dc2626; color: white;")
+        self.btn_close.setObjectName("tabCloseBtn")
         
         self.btn_popout = QPushButton("⬜")
         self.btn_popout.setFixedSize(40, 30)
@@ -482,59 +1022,68 @@ class PDFTab(QWidget):
 
         self.scroll.setWidget(self.label)
         self.scroll.setWidgetResizable(True)
+        self.scroll.horizontalScrollBar().valueChanged.connect(self._on_scrolled)
+        self.scroll.verticalScrollBar().valueChanged.connect(self._on_scrolled)
         layout.addWidget(self.scroll)
-        
-        self.render()
+
+        # Defer the first render one event-loop turn: the tab is usually
+        # about to be docked/tabified, and rendering after that avoids
+        # rasterizing into a widget whose geometry is still changing
+        QTimer.singleShot(0, self.render)
 
 
     
     def zoom_in(self):
         self.scale *= 1.2
         self.update_zoom_label()
-        self.render()
-    
+        self._zoom_timer.start()
+
     def zoom_out(self):
         self.scale /= 1.2
         self.update_zoom_label()
-        self.render()
+        self._zoom_timer.start()
     
     def fit_to_screen(self):
         """Fit to width (same as fit_to_width for backward compatibility)"""
         self.fit_to_width()
     
+    def _page_size(self, page_no):
+        """Page rect dimensions in points, memoized per page"""
+        size = self._page_sizes.get(page_no)
+        if size is None:
+            rect = self.doc.load_page(page_no).rect
+            size = (rect.width, rect.height)
+            self._page_sizes[page_no] = size
+        return size
+
     def fit_to_width(self):
         if not self.doc: return
         try:
-            page = self.doc.load_page(self.current_page)
-            page_width = page.rect.width
+            page_width = self._page_size(self.current_page)[0]
             scroll_width = self.scroll.width() - 40  # Account for margins
             self.scale = scroll_width / page_width
             self.update_zoom_label()
-            self.render()
+            self._zoom_timer.start()
         except Exception as e:
-            print(f"Fit width error: {e}")
+            log.warning("Fit width error: %s", e)
     
     def fit_to_height(self):
         if not self.doc: return
         try:
-            page = self.doc.load_page(self.current_page)
-            page_height = page.rect.height
+            page_height = self._page_size(self.current_page)[1]
             scroll_height = self.scroll.height() - 40  # Account for margins
             self.scale = scroll_height / page_height
             self.update_zoom_label()
-            self.render()
+            self._zoom_timer.start()
         except Exception as e:
-            print(f"Fit height error: {e}")
+            log.warning("Fit height error: %s", e)
     
     def close_self(self):
         """Close this dock"""
         if self.parent_dock:
-            # Find parent PDFEditorModule
-            parent = self.parent()
-            while parent and not isinstance(parent, PDFEditorModule):
-                parent = parent.parent()
-            if parent:
-                parent.close_tab(self.parent_dock)
+            module = self._find_module()
+            if module:
+                module.close_tab(self.parent_dock)
     
     def pop_out(self):
         """Pop out to floating window"""
@@ -551,7 +1100,7 @@ class PDFTab(QWidget):
             self.render()
 
     def next_page(self):
-        if self.doc and self.current_page < len(self.doc) - 1:
+        if self.doc and self.current_page < self._page_count - 1:
             self.current_page += 1
             self.render()
 
@@ -559,51 +1108,368 @@ class PDFTab(QWidget):
         if not self.doc: return
         try:
             # Update Page Label
-            total_pages = len(self.doc)
+            total_pages = self._page_count
             self.lbl_page.setText(f"Page {self.current_page + 1} / {total_pages}")
             
             # Enable/Disable buttons
             self.btn_prev.setEnabled(self.current_page > 0)
             self.btn_next.setEnabled(self.current_page < total_pages - 1)
             
-            page = self.doc.load_page(self.current_page)
-            pix = page.get_pixmap(matrix=fitz.Matrix(self.scale, self.scale))
-            img = QImage(pix.samples, pix.width, pix.height, pix.stride, QImage.Format_RGB888)
-            self.label.setPixmap(QPixmap.fromImage(img))
+            key = (self.current_page, round(self.scale, 3))
+            if key == self._last_rendered:
+                return
+            self._last_rendered = key
+
+            # Tile-on-demand path: at 300%+ a whole-page raster costs
+            # O(page area) while the user can only see the viewport
+            if self.scale >= self._TILE_SCALE_THRESHOLD:
+                self._render_tiled(key)
+                return
+
+            cached = self._pix_cache.get(key)
+            if cached is not None:
+                self._pix_cache.move_to_end(key)
+                self.label.setPixmap(cached[0])
+                self._prefetch_neighbors()
+                return
+
+            # Native QtPdf render when the on-disk file is still current -
+            # returns a QImage directly, no samples-buffer copy
+            if self._qpdf is not None:
+                page_w, page_h = self._page_size(self.current_page)
+                img = self._qpdf.render(self.current_page,
+                                        QSize(int(page_w * self.scale),
+                                              int(page_h * self.scale)))
+                pixmap = QPixmap.fromImage(img)
+                self.label.setPixmap(pixmap)
+                self._cache_put(key, pixmap, img.sizeInBytes())
+                self._prefetch_neighbors()
+                return
+
+            # Progressive render: put up a cheap quarter-scale preview
+            # (~16x fewer pixels) immediately, stretched to target size,
+            # while the full-resolution raster runs on a pool thread and
+            # swaps in via _on_prefetch_done.
+            preview_scale = self.scale * 0.25
+            preview_key = (self.current_page, round(preview_scale, 3))
+            preview = self._pix_cache.get(preview_key)
+            if preview is None:
+                # alpha=False so MuPDF paints the page background white -
+                # transparent pixels would composite over the margin fill
+                with self._doc_lock:
+                    page = self.doc.load_page(self.current_page)
+                    pix = page.get_pixmap(matrix=fitz.Matrix(preview_scale, preview_scale))
+                img = QImage(pix.samples, pix.width, pix.height, pix.stride, QImage.Format_RGB888)
+                preview_pixmap = QPixmap.fromImage(img)
+                self._cache_put(preview_key, preview_pixmap, pix.height * pix.stride)
+            else:
+                self._pix_cache.move_to_end(preview_key)
+                preview_pixmap = preview[0]
+
+            self.label.setPixmap(preview_pixmap.scaled(
+                preview_pixmap.width() * 4, preview_pixmap.height() * 4,
+                Qt.IgnoreAspectRatio, Qt.FastTransformation))
+
+            if key not in self._prefetching:
+                self._prefetching.add(key)
+                QThreadPool.globalInstance().start(
+                    _PageRenderJob(self, self.current_page, self.scale))
+            self._prefetch_neighbors()
         except Exception as e:
-            print(f"Render error: {e}")
-    
+            self._last_rendered = None
+            log.warning("Render error: %s", e)
+
+    def _on_scrolled(self, _value):
+        if self.scale >= self._TILE_SCALE_THRESHOLD:
+            self._scroll_timer.start()
+
+    def _render_tiled(self, key):
+        """High-zoom render: page-sized backing pixmap filled tile by tile,
+        only ever rastering what the viewport can show"""
+        cached = self._pix_cache.get(key)
+        if cached is None:
+            page_w, page_h = self._page_size(self.current_page)
+            w = max(1, int(page_w * self.scale))
+            h = max(1, int(page_h * self.scale))
+            backing = QPixmap(w, h)
+            backing.fill(Qt.white)
+            # The blank backing replaces any evicted one - forget its tiles
+            self._tiles_done = {t for t in self._tiles_done if t[:2] != key}
+            self._cache_put(key, backing, w * h * 4)
+        else:
+            self._pix_cache.move_to_end(key)
+            backing = cached[0]
+        self.label.setPixmap(backing)
+        self._render_visible_tiles()
+
+    def _render_visible_tiles(self):
+        """Raster the 512-px tiles intersecting the viewport that haven't
+        been painted into the backing pixmap yet"""
+        if not self.doc or self.scale < self._TILE_SCALE_THRESHOLD:
+            return
+        key = (self.current_page, round(self.scale, 3))
+        cached = self._pix_cache.get(key)
+        if cached is None:
+            return
+        backing = cached[0]
+        try:
+            # Scrollbar values are label coordinates; the pixmap may be
+            # centered inside a larger label
+            off_x = max(0, (self.label.width() - backing.width()) // 2)
+            off_y = max(0, (self.label.height() - backing.height()) // 2)
+            viewport = self.scroll.viewport()
+            x0 = max(0, self.scroll.horizontalScrollBar().value() - off_x)
+            y0 = max(0, self.scroll.verticalScrollBar().value() - off_y)
+            x1 = min(backing.width(), x0 + viewport.width())
+            y1 = min(backing.height(), y0 + viewport.height())
+
+            T = self._TILE_PX
+            mat = fitz.Matrix(self.scale, self.scale)
+            painter = None
+            for ty in range(y0 // T, (y1 + T - 1) // T):
+                for tx in range(x0 // T, (x1 + T - 1) // T):
+                    tkey = key + (tx, ty)
+                    if tkey in self._tiles_done:
+                        continue
+                    px, py = tx * T, ty * T
+                    tw = min(T, backing.width() - px)
+                    th = min(T, backing.height() - py)
+                    if tw <= 0 or th <= 0:
+                        continue
+                    clip = fitz.Rect(px / self.scale, py / self.scale,
+                                     (px + tw) / self.scale,
+                                     (py + th) / self.scale)
+                    with self._doc_lock:
+                        page = self.doc.load_page(self.current_page)
+                        pix = page.get_pixmap(matrix=mat, clip=clip, alpha=True)
+                    img = QImage(pix.samples, pix.width, pix.height,
+                                 pix.stride, QImage.Format_RGBA8888)
+                    if painter is None:
+                        painter = QPainter(backing)
+                    painter.drawImage(px, py, img)
+                    self._tiles_done.add(tkey)
+            if painter is not None:
+                painter.end()
+                # setPixmap took a shared copy - push the updated backing
+                self.label.setPixmap(backing)
+        except Exception as e:
+            log.warning("Tile render error: %s", e)
+
+    def _prefetch_neighbors(self):
+        """Queue background renders of adjacent pages so the next
+        navigation click lands on a cache hit"""
+        total = self._page_count
+        s = round(self.scale, 3)
+        for page_no in (self.current_page + 1, self.current_page - 1,
+                        self.current_page + 2):
+            if 0 <= page_no < total:
+                key = (page_no, s)
+                if key not in self._pix_cache and key not in self._prefetching:
+                    self._prefetching.add(key)
+                    QThreadPool.globalInstance().start(
+                        _PageRenderJob(self, page_no, self.scale))
+
+    def _on_prefetch_done(self, page_no, scale, pix, width, height, stride):
+        key = (page_no, round(scale, 3))
+        self._prefetching.discard(key)
+        # Failed render - the key is freed above so a later
+        # _prefetch_neighbors pass can retry the page
+        if pix is None:
+            return
+        # Drop results rendered for a superseded zoom level
+        if key in self._pix_cache or round(scale, 3) != round(self.scale, 3):
+            return
+        # samples_mv is a zero-copy view; fromImage deep-copies into Qt's
+        # own storage, after which the Pixmap is free to die
+        buf = getattr(pix, "samples_mv", None) or pix.samples
+        img = QImage(buf, width, height, stride, QImage.Format_RGB888)
+        pixmap = QPixmap.fromImage(img)
+        self._cache_put(key, pixmap, height * stride)
+        # Full-resolution result for the page on screen - replace the
+        # stretched preview
+        if page_no == self.current_page:
+            self.label.setPixmap(pixmap)
+
+    def _cache_put(self, key, pixmap, nbytes):
+        self._pix_cache[key] = (pixmap, nbytes)
+        self._pix_cache_bytes += nbytes
+        while self._pix_cache_bytes > self._pix_cache_limit and self._pix_cache:
+            # Never evict the entry just inserted, even when it alone
+            # exceeds the limit (a tile backing for a large page at high
+            # zoom can) - dropping it would leave the page blank, since
+            # the tile pass only paints into a cached backing
+            if next(iter(self._pix_cache)) == key:
+                break
+            _, (_, evicted) = self._pix_cache.popitem(last=False)
+            self._pix_cache_bytes -= evicted
+
+    def refresh(self):
+        """Re-render after the document was modified - all cached pixmaps
+        for this doc are stale"""
+        self._pix_cache.clear()
+        self._pix_cache_bytes = 0
+        self._tiles_done.clear()
+        self._doc_generation += 1
+        self._page_count = len(self.doc) if self.doc else 0
+        self._page_sizes.clear()
+        self._has_rotation = None
+        # The fitz doc no longer matches the file QtPdf loaded
+        self._qpdf = None
+        self._last_rendered = None
+        self.schedule_render()
+
+    def schedule_render(self):
+        """Coalesce redraw requests - back-to-back mutations (add, undo,
+        add again) used to rasterize the page once per call with only the
+        last result ever shown"""
+        if self._render_pending:
+            return
+        self._render_pending = True
+        QTimer.singleShot(16, self._flush_render)
+
+    def _flush_render(self):
+        self._render_pending = False
+        self.render()
+
     def cleanup(self):
         """Clean up temp files and close document"""
+        self._pix_cache.clear()
+        self._pix_cache_bytes = 0
         if self.doc:
             try:
-                self.doc.close()
-                self.doc = None
+                # Take the doc lock so an in-flight prefetch can't touch a
+                # closed document
+                with self._doc_lock:
+                    self.doc.close()
+                    self.doc = None
             except Exception as e:
-                print(f"Failed to close doc: {e}")
+                log.warning("Failed to close doc: %s", e)
 
         if self.is_temp and self.temp_path and os.path.exists(self.temp_path):
             try:
                 os.remove(self.temp_path)
                 print(f"Deleted temp file: {self.temp_path}")
             except Exception as e:
-                print(f"Failed to delete temp file: {e}")
+                log.warning("Failed to delete temp file: %s", e)
+
+
+class _RedactSignals(QObject):
+    """Signal bridge for _RedactJob - QRunnable can't emit on its own"""
+    page_done = Signal(int)
+    finished = Signal()
+    failed = Signal(str)
+
+
+class _RedactJob(QRunnable):
+    """Applies queued redactions page by page off the GUI thread"""
+    def __init__(self, tab, pages, signals):
+        super().__init__()
+        self.tab = tab
+        self.pages = pages
+        self.signals = signals
+
+    def run(self):
+        try:
+            # Serialize against renders/prefetches on the tab's doc lock
+            with self.tab._doc_lock:
+                for n, pg in enumerate(self.pages):
+                    pg.apply_redactions()
+                    self.signals.page_done.emit(n + 1)
+            self.signals.finished.emit()
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+
+
+def _clear_layout(layout):
+    """Detach and delete a layout's widgets synchronously. Plain
+    deleteLater() on still-attached widgets queues N events and keeps the
+    old rows alive (and re-laid-out) while the new ones are added."""
+    while layout.count():
+        item = layout.takeAt(0)
+        widget = item.widget()
+        if widget:
+            widget.setParent(None)
+            widget.deleteLater()
+
+
+class _HeaderPageModel(QAbstractListModel):
+    """Backs the header-selection list in the header merge with plain data
+    rows. The old step-2 UI built a QWidget + QCheckBox + QLineEdit per
+    page up front; a QListView over this model only materializes visible
+    rows, so 1000-page base PDFs open the dialog instantly."""
+
+    def __init__(self, page_count=0):
+        super().__init__()
+        self._checked = []
+        self._labels = []
+        self.reset_pages(page_count)
+
+    def reset_pages(self, page_count):
+        self.beginResetModel()
+        self._checked = [False] * page_count
+        self._labels = [""] * page_count
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()):
+        return len(self._checked)
+
+    def data(self, index, role=Qt.DisplayRole):
+        row = index.row()
+        if role == Qt.DisplayRole:
+            label = self._labels[row]
+            return f"Page {row + 1}" + (f"  [{label}]" if label else "")
+        if role == Qt.EditRole:
+            return self._labels[row]
+        if role == Qt.CheckStateRole:
+            return Qt.Checked if self._checked[row] else Qt.Unchecked
+        return None
+
+    def setData(self, index, value, role=Qt.EditRole):
+        row = index.row()
+        if role == Qt.CheckStateRole:
+            self._checked[row] = Qt.CheckState(value) == Qt.Checked
+        elif role == Qt.EditRole:
+            self._labels[row] = str(value)
+        else:
+            return False
+        self.dataChanged.emit(index, index)
+        return True
+
+    def flags(self, index):
+        return (Qt.ItemIsEnabled | Qt.ItemIsSelectable |
+                Qt.ItemIsUserCheckable | Qt.ItemIsEditable)
+
+    def checked_headers(self):
+        """(page_num, label) for every checked row, in page order"""
+        return [(row, self._labels[row])
+                for row, checked in enumerate(self._checked) if checked]
 
 
 class PDFEditorModule(QWidget):
     def __init__(self):
         super().__init__()
+        # One-time handler setup; no-op if the app already configured logging
+        logging.basicConfig(level=logging.WARNING)
+        # Qt's global pixmap cache defaults to 10 MB - far too small for a
+        # viewer full of page-sized pixmaps and list icons (64 MB, in KB)
+        QPixmapCache.setCacheLimit(64 * 1024)
         # Create temp directory
         self.temp_dir = os.path.join(os.getcwd(), ".temp_pdfs")
         os.makedirs(self.temp_dir, exist_ok=True)
         self._last_active_tab = None
+        # Rasterized-page JPEG LRU keyed by (doc id, page, zoom) - repeat
+        # rasterize passes skip both the MuPDF render and the JPEG encode
+        self._jpeg_cache = collections.OrderedDict()
         self.setup_ui()
     
     def setup_ui(self):
+        # One QSS parse; buttons opt in by object name (cascades to tabs)
+        self.setStyleSheet(MODULE_TOOLBAR_QSS)
+
         layout = QVBoxLayout(self)
         layout.setContentsMargins(20, 20, 20, 20)
         layout.setSpacing(15)
-        
+
         # Title
         title = QLabel("📄 PDF Editor")
         title.setObjectName("moduleTitle")
@@ -664,52 +1530,22 @@ class PDFEditorModule(QWidget):
 
     def create_btn(self, text, callback):
         btn = QPushButton(text)
-        btn.setStyleSheet("""
-            QPushButton {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                    stop:0 #667EEA, stop:1 #764BA2);
-                color: white; border: none; padding: 10px 20px;
-                border-radius: 6px; font-size: 14px; font-weight: 500;
-            }
-            QPushButton:hover { background: #764BA2; }
-        """)
+        btn.setObjectName("moduleToolbarBtn")
         btn.clicked.connect(callback)
         return btn
     
     def current_tab(self):
-        from PySide6.QtWidgets import QApplication, QTabBar
-        
-        # 1. Check if any tab's child widget currently has focus
-        focus_widget = QApplication.focusWidget()
-        if focus_widget:
+        # _last_active_tab is kept current by PDFTab.focusInEvent and
+        # on_dock_visibility_changed, so no widget-tree traversal or
+        # window-title matching is needed here - just validate the pointer
+        # still belongs to an open dock
+        if self._last_active_tab is not None:
             for dock in self.docks:
-                tab = dock.widget()
-                if tab == focus_widget or tab.isAncestorOf(focus_widget):
-                    self._last_active_tab = tab
-                    return tab
-        
-        # 2. Find the active dock in a tabbed group by finding tab bars
-        # In Qt, when docks are tabbed, there's a QTabBar child of the dock area
-        for child in self.dock_manager.findChildren(QTabBar):
-            current_index = child.currentIndex()
-            if current_index >= 0:
-                # Get the text of the current tab to match with dock titles
-                tab_text = child.tabText(current_index)
-                for dock in self.docks:
-                    if dock.windowTitle() == tab_text:
-                        self._last_active_tab = dock.widget()
-                        return dock.widget()
-        
-        # 3. Fall back to last known active tab
-        if self._last_active_tab and self._last_active_tab in [d.widget() for d in self.docks]:
-            return self._last_active_tab
+                if dock.widget() is self._last_active_tab:
+                    return self._last_active_tab
+            self._last_active_tab = None
 
-        # 4. Fallback: Return first visible dock
-        for dock in self.docks:
-            if dock.isVisible() and not dock.isHidden():
-                return dock.widget()
-        
-        # 5. Last resort: just the latest dock
+        # Fallback: the latest dock
         if self.docks:
             return self.docks[-1].widget()
         return None
@@ -719,7 +1555,12 @@ class PDFEditorModule(QWidget):
             # Cleanup temp files
             tab = dock.widget()
             if tab and hasattr(tab, 'cleanup'):
+                doc_id = id(tab.doc) if getattr(tab, 'doc', None) else None
                 tab.cleanup()
+                # Rasterized JPEGs for this doc can never hit again
+                if doc_id is not None:
+                    for key in [k for k in self._jpeg_cache if k[0] == doc_id]:
+                        del self._jpeg_cache[key]
             
             # Check for unsaved changes (mockup)
             reply = QMessageBox.question(self, "Close", "Save changes before closing?", 
@@ -732,6 +1573,8 @@ class PDFEditorModule(QWidget):
             self.dock_manager.removeDockWidget(dock)
             dock.deleteLater()
             self.docks.remove(dock)
+            if tab is self._last_active_tab:
+                self._last_active_tab = None
 
     def close_all(self):
         reply = QMessageBox.question(self, "Close All", "Close all tabs without saving?", 
@@ -764,14 +1607,13 @@ class PDFEditorModule(QWidget):
                     import uuid
                     temp_filename = f"{uuid.uuid4().hex}.pdf"
                     temp_path = os.path.join(self.temp_dir, temp_filename)
-                    
-                    # Convert to temp location
-                    import shutil
-                    converted_path = OfficeConverter.convert_to_pdf(path)
+
+                    # Convert straight into the temp location - the Office
+                    # app writes the PDF once, no copy/move afterwards
+                    converted_path = OfficeConverter.convert_to_pdf(path, out_path=temp_path)
                     if not converted_path:
                         raise Exception("Conversion failed")
-                    
-                    shutil.move(converted_path, temp_path)
+
                     path = temp_path
                     is_temp = True
                 
@@ -787,6 +1629,7 @@ class PDFEditorModule(QWidget):
                 
                 # Set parent_dock reference
                 tab.parent_dock = dock
+                tab._module = self
                 
                 # Rename feature via context menu
                 dock.setContextMenuPolicy(Qt.CustomContextMenu)
@@ -796,7 +1639,9 @@ class PDFEditorModule(QWidget):
                 dock.visibilityChanged.connect(self.on_dock_visibility_changed)
 
                 # Connect interactive selection signal
-                tab.label.selection_confirmed.connect(lambda rect: self.apply_custom_redaction(tab, rect))
+                tab.label.selection_confirmed.connect(
+                    lambda rect: self.apply_custom_redaction(tab, rect),
+                    Qt.DirectConnection)  # Same-thread emit - skip the queued-event path
                 
                 self.dock_manager.addDockWidget(Qt.RightDockWidgetArea, dock)
                 if self.docks:
@@ -857,9 +1702,11 @@ class PDFEditorModule(QWidget):
             try:
                 # Save compressed to new file
                 tab.doc.save(path, garbage=4, deflate=True)
-                # Open result in new tab
+                # Open result in new tab - garbage/deflate don't change how
+                # pages look, so the source tab's rendered pixmaps are
+                # valid for the compressed copy and page 1 shows instantly
                 new_doc = fitz.open(path)
-                new_tab = PDFTab(new_doc, path)
+                new_tab = PDFTab(new_doc, path, initial_cache=tab._pix_cache)
                 
                 # Create Dock Widget
                 from PySide6.QtWidgets import QDockWidget
@@ -872,6 +1719,7 @@ class PDFEditorModule(QWidget):
                 
                 # Set parent_dock reference
                 new_tab.parent_dock = dock
+                new_tab._module = self
                 
                 self.dock_manager.addDockWidget(Qt.RightDockWidgetArea, dock)
                 if self.docks:
@@ -981,25 +1829,71 @@ class PDFEditorModule(QWidget):
         layout.addLayout(content_layout)
         
         # Load pages logic
+        def render_thumb(job):
+            """Render (or reuse from disk) one page thumbnail - runs in a
+            worker thread; MuPDF releases the GIL while rasterizing"""
+            pdf_idx, pdf_path, page_num = job
+            try:
+                # Scale to the 100x140 icon box (times device pixel ratio)
+                # instead of a fixed 0.3 - a fixed scale rendered ~6x the
+                # pixels Qt then threw away shrinking to the icon
+                icon_w, icon_h = 100, 140
+                dpr = self.devicePixelRatioF()
+                thumb_dir = os.path.join(self.temp_dir, "thumb_cache")
+                cache_name = "{}_{}_{}_{}.png".format(
+                    hashlib.sha256(pdf_path.encode()).hexdigest()[:16],
+                    int(os.path.getmtime(pdf_path)), page_num,
+                    round(dpr, 2))
+                cache_file = os.path.join(thumb_dir, cache_name)
+                if not os.path.exists(cache_file):
+                    # Workers open their own document handle - a shared
+                    # fitz.Document is not thread-safe
+                    doc = fitz.open(pdf_path)
+                    page = doc.load_page(page_num)
+                    s = min(icon_w / page.rect.width,
+                            icon_h / page.rect.height) * dpr
+                    # alpha=False keeps the page background opaque white -
+                    # thumbnail PNGs would otherwise save with transparency
+                    pix = page.get_pixmap(matrix=fitz.Matrix(s, s))
+                    doc.close()
+                    img = QImage(pix.samples, pix.width, pix.height,
+                                 pix.stride, QImage.Format_RGB888)
+                    img.save(cache_file)
+                return (pdf_idx, os.path.basename(pdf_path), page_num, cache_file)
+            except Exception as e:
+                log.warning("Error: %s", e)
+                return None
+
         def load_pages():
             page_listwidget.clear()
+            os.makedirs(os.path.join(self.temp_dir, "thumb_cache"), exist_ok=True)
+
+            jobs = []
             for i in range(pdf_listwidget.count()):
                 pdf_path = pdf_listwidget.item(i).text()
                 try:
                     doc = fitz.open(pdf_path)
-                    pdf_name = os.path.basename(pdf_path)
-                    for page_num in range(len(doc)):
-                        page = doc.load_page(page_num)
-                        pix = page.get_pixmap(matrix=fitz.Matrix(0.3, 0.3))
-                        img = QImage(pix.samples, pix.width, pix.height, pix.stride, QImage.Format_RGB888)
-                        item = QListWidgetItem(QPixmap.fromImage(img), f"{pdf_name}\nP{page_num + 1}")
-                        item.setData(Qt.UserRole, (i, page_num))
-                        page_listwidget.addItem(item)
+                    page_count = len(doc)
                     doc.close()
                 except Exception as e:
-                    print(f"Error: {e}")
-        btn_load_pages.clicked.connect(load_pages)
-        
+                    log.warning("Error: %s", e)
+                    continue
+                jobs.extend((i, pdf_path, n) for n in range(page_count))
+
+            # Rasterize thumbnails across all cores; map() keeps results in
+            # pdf/page order so the list builds up deterministically
+            with ThreadPoolExecutor(max_workers=os.cpu_count() or 1) as pool:
+                results = list(pool.map(render_thumb, jobs))
+
+            for result in results:
+                if result is None:
+                    continue
+                pdf_idx, pdf_name, page_num, cache_file = result
+                item = QListWidgetItem(QPixmap(cache_file), f"{pdf_name}\nP{page_num + 1}")
+                item.setData(Qt.UserRole, (pdf_idx, page_num))
+                page_listwidget.addItem(item)
+        btn_load_pages.clicked.connect(load_pages)
+        
         buttons = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
         buttons.accepted.connect(dialog.accept)
         buttons.rejected.connect(dialog.reject)
@@ -1007,37 +1901,65 @@ class PDFEditorModule(QWidget):
         
         if dialog.exec() == QDialog.Accepted and page_listwidget.count() > 0:
             try:
-                merged = fitz.open()
-                pdf_docs = [fitz.open(pdf_listwidget.item(i).text()) for i in range(pdf_listwidget.count())]
-                
+                # Walk the arrangement and coalesce consecutive pages from
+                # the same source into one insert_pdf run (same pattern as
+                # the header merge) - inserting straight from each source
+                # keeps insert_pdf's per-source graft map, so fonts/images
+                # shared between a source's pages are copied once, and no
+                # intermediate single-page docs pile up in memory
+                order = []
                 for i in range(page_listwidget.count()):
-                    item = page_listwidget.item(i)
-                    pdf_idx, page_num = item.data(Qt.UserRole)
-                    merged.insert_pdf(pdf_docs[pdf_idx], from_page=page_num, to_page=page_num)
-                
-                for doc in pdf_docs:
-                    doc.close()
-                
+                    order.append(page_listwidget.item(i).data(Qt.UserRole))
+
+                runs = []  # (pdf_idx, first page, last page)
+                for pdf_idx, page_num in order:
+                    if (runs and runs[-1][0] == pdf_idx and
+                            runs[-1][2] + 1 == page_num):
+                        runs[-1][2] = page_num
+                    else:
+                        runs.append([pdf_idx, page_num, page_num])
+
+                # Sources open lazily on first use and stay open for the
+                # assembly so every run from one file shares its graft map
+                merged = fitz.open()
+                src_docs = {}
+                try:
+                    for pdf_idx, first, last in runs:
+                        src = src_docs.get(pdf_idx)
+                        if src is None:
+                            src = fitz.open(pdf_listwidget.item(pdf_idx).text())
+                            src_docs[pdf_idx] = src
+                        merged.insert_pdf(src, from_page=first, to_page=last)
+                finally:
+                    for src in src_docs.values():
+                        src.close()
+
                 tab = PDFTab(merged, "Merged.pdf")
-                
-                # Create Dock Widget
+
+                # Create Dock Widget - freeze the dock area while the new
+                # dock is added and tabified so the chrome repaints once
                 from PySide6.QtWidgets import QDockWidget
-                dock = QDockWidget("Merged.pdf", self)
-                dock.setWidget(tab)
-                dock.setAllowedAreas(Qt.AllDockWidgetAreas)
-                dock.setFeatures(QDockWidget.DockWidgetMovable | QDockWidget.DockWidgetFloatable | QDockWidget.DockWidgetClosable)
-                dock.setContextMenuPolicy(Qt.CustomContextMenu)
-                dock.customContextMenuRequested.connect(lambda pos, d=dock: self.dock_context_menu(pos, d))
-                
-                # Set parent_dock reference
-                tab.parent_dock = dock
-                
-                self.dock_manager.addDockWidget(Qt.RightDockWidgetArea, dock)
-                if self.docks:
-                    self.dock_manager.tabifyDockWidget(self.docks[-1], dock)
-                self.docks.append(dock)
-                dock.show()
-                
+                self.dock_manager.setUpdatesEnabled(False)
+                try:
+                    dock = QDockWidget("Merged.pdf", self)
+                    dock.setWidget(tab)
+                    dock.setAllowedAreas(Qt.AllDockWidgetAreas)
+                    dock.setFeatures(QDockWidget.DockWidgetMovable | QDockWidget.DockWidgetFloatable | QDockWidget.DockWidgetClosable)
+                    dock.setContextMenuPolicy(Qt.CustomContextMenu)
+                    dock.customContextMenuRequested.connect(lambda pos, d=dock: self.dock_context_menu(pos, d))
+
+                    # Set parent_dock reference
+                    tab.parent_dock = dock
+                    tab._module = self
+
+                    self.dock_manager.addDockWidget(Qt.RightDockWidgetArea, dock)
+                    if self.docks:
+                        self.dock_manager.tabifyDockWidget(self.docks[-1], dock)
+                    self.docks.append(dock)
+                    dock.show()
+                finally:
+                    self.dock_manager.setUpdatesEnabled(True)
+
                 QMessageBox.information(self, "Success", f"Merged {page_listwidget.count()} pages!")
             except Exception as e:
                 QMessageBox.critical(self, "Error", str(e))
@@ -1069,6 +1991,11 @@ class PDFEditorModule(QWidget):
         base_pdf = None
         headers = []  # [(page_num, label), ...]
         insertions = {}  # {page_num: [pdf_paths]}
+
+        # Step-3 models in a parallel list, indexed by header group -
+        # avoids the QVariant round-trip of stashing refs in widget
+        # properties and the layout walks to fish them back out
+        insert_lists = []  # (page_num, QStringListModel) per header group
         
         # STEP 1: Select base PDF
         step1 = QWidget()
@@ -1091,17 +2018,19 @@ class PDFEditorModule(QWidget):
         step1_layout.addWidget(btn_select_base)
         stack.addWidget(step1)
         
-        # STEP 2: Mark headers
+        # STEP 2: Mark headers - a model-backed view, so only visible rows
+        # get widgets no matter how many pages the base PDF has
         step2 = QWidget()
         step2_layout = QVBoxLayout(step2)
         step2_layout.addWidget(QLabel("<h2>Step 2: Mark Header Pages</h2>"))
-        
-        header_scroll = QScrollArea()
-        header_container = QWidget()
-        header_container_layout = QVBoxLayout(header_container)
-        header_scroll.setWidget(header_container)
-        header_scroll.setWidgetResizable(True)
-        step2_layout.addWidget(header_scroll)
+        step2_layout.addWidget(QLabel("Check header pages; double-click a row to set its label:"))
+
+        from PySide6.QtWidgets import QListView
+        header_model = _HeaderPageModel()
+        header_view = QListView()
+        header_view.setModel(header_model)
+        header_view.setUniformItemSizes(True)
+        step2_layout.addWidget(header_view)
         stack.addWidget(step2)
         
         # STEP 3: Insert PDFs after headers
@@ -1128,38 +2057,15 @@ class PDFEditorModule(QWidget):
             if not base_pdf:
                 QMessageBox.warning(dialog, "Warning", "Please select a base PDF")
                 return
-            
-            # Load base PDF and show pages
-            for i in reversed(range(header_container_layout.count())):
-                header_container_layout.itemAt(i).widget().deleteLater()
-            
+
+            # Only the page count is needed here - doc.page_count comes off
+            # the trailer/xref without touching any page content
             try:
                 doc = fitz.open(base_pdf)
-                from PySide6.QtWidgets import QCheckBox
-                for page_num in range(len(doc)):
-                    row = QHBoxLayout()
-                    cb = QCheckBox(f"Page {page_num + 1}")
-                    cb.setProperty("page_num", page_num)
-                    label_input = QLineEdit()
-                    label_input.setPlaceholderText("Header label (e.g., 'Section 1')")
-                    label_input.setEnabled(False)
-                    
-                    # Fix: Use a separate function to capture closure correctly
-                    def connect_cb(checkbox, input_field):
-                        checkbox.stateChanged.connect(lambda state: input_field.setEnabled(state == 2))
-                    
-                    connect_cb(cb, label_input)
-                    
-                    row.addWidget(cb)
-                    row.addWidget(label_input)
-                    
-                    widget = QWidget()
-                    widget.setLayout(row)
-                    widget.setProperty("checkbox", cb)
-                    widget.setProperty("label_input", label_input)
-                    header_container_layout.addWidget(widget)
-                
-                doc.close()
+                try:
+                    header_model.reset_pages(doc.page_count)
+                finally:
+                    doc.close()
             except Exception as e:
                 QMessageBox.critical(dialog, "Error", str(e))
                 return
@@ -1174,15 +2080,8 @@ class PDFEditorModule(QWidget):
             nonlocal headers
             headers = []
             
-            for i in range(header_container_layout.count()):
-                widget = header_container_layout.itemAt(i).widget()
-                cb = widget.property("checkbox")
-                label_inp = widget.property("label_input")
-                
-                if cb and cb.isChecked():
-                    page_num = cb.property("page_num")
-                    label = label_inp.text() if label_inp and label_inp.text() else f"Header {len(headers) + 1}"
-                    headers.append((page_num, label))
+            for page_num, label in header_model.checked_headers():
+                headers.append((page_num, label or f"Header {len(headers) + 1}"))
             
             if not headers:
                 QMessageBox.warning(dialog, "Warning", "Please mark at least one header page")
@@ -1190,32 +2089,42 @@ class PDFEditorModule(QWidget):
             
             headers.sort()  # Sort by page number
             
-            # Build insertion UI
-            for i in reversed(range(insert_container_layout.count())):
-                insert_container_layout.itemAt(i).widget().deleteLater()
-            
-            from PySide6.QtWidgets import QFrame
+            # Build insertion UI - suppress repaints while rows churn
+            insert_container.setUpdatesEnabled(False)
+            _clear_layout(insert_container_layout)
+            insert_lists.clear()
+
+            from PySide6.QtWidgets import QFrame, QListView
+            from PySide6.QtCore import QStringListModel
             for page_num, label in headers:
                 group = QFrame()
                 group.setFrameStyle(QFrame.Box)
                 group_layout = QVBoxLayout(group)
                 group_layout.addWidget(QLabel(f"<b>📌 After '{label}' (Page {page_num + 1})</b>"))
-                
-                list_widget = QListWidget()
-                list_widget.setProperty("page_num", page_num)
-                
+
+                # QListView over a string-list model: the view only creates
+                # items for visible rows, and adding many files is one model
+                # reset instead of per-item widget inserts
+                list_model = QStringListModel()
+                list_view = QListView()
+                list_view.setModel(list_model)
+                list_view.setUniformItemSizes(True)
+                insert_lists.append((page_num, list_model))
+
                 btn_add_pdfs = QPushButton("+ Add PDFs")
-                def add_pdfs_for_header(pg=page_num, lst=list_widget):
+                def add_pdfs_for_header(pg=page_num, mdl=list_model):
                     files, _ = QFileDialog.getOpenFileNames(dialog, "Select PDFs", "", "PDF Files (*.pdf)")
-                    for f in files:
-                        lst.addItem(f)
-                
+                    if files:
+                        mdl.setStringList(mdl.stringList() + files)
+
                 btn_add_pdfs.clicked.connect(add_pdfs_for_header)
-                
-                group_layout.addWidget(list_widget)
+
+                group_layout.addWidget(list_view)
                 group_layout.addWidget(btn_add_pdfs)
                 insert_container_layout.addWidget(group)
-            
+
+            insert_container.setUpdatesEnabled(True)
+
             stack.setCurrentIndex(2)
             btn_back.setVisible(True)
             btn_next.setVisible(False)
@@ -1226,21 +2135,11 @@ class PDFEditorModule(QWidget):
             nonlocal insertions
             insertions = {}
             
-            for i in range(insert_container_layout.count()):
-                group_widget = insert_container_layout.itemAt(i).widget()
-                if not group_widget: continue
-                
-                # Find the list widget
-                for j in range(group_widget.layout().count()):
-                    item = group_widget.layout().itemAt(j)
-                    if not item: continue
-                    widget = item.widget()
-                    if isinstance(widget, QListWidget):
-                        page_num = widget.property("page_num")
-                        pdfs = [widget.item(k).text() for k in range(widget.count())]
-                        if pdfs:
-                            insertions[page_num] = pdfs
-            
+            for page_num, list_model in insert_lists:
+                pdfs = list_model.stringList()
+                if pdfs:
+                    insertions[page_num] = pdfs
+
             dialog.accept()
         
         btn_back.clicked.connect(lambda: go_step1() if stack.currentIndex() == 1 else go_step2())
@@ -1254,40 +2153,57 @@ class PDFEditorModule(QWidget):
                 # Build final merged PDF
                 base_doc = fitz.open(base_pdf)
                 merged = fitz.open()
-                
-                for page_num in range(len(base_doc)):
-                    # Insert base page
-                    merged.insert_pdf(base_doc, from_page=page_num, to_page=page_num)
-                    
-                    # If this is a header, insert PDFs after it
-                    if page_num in insertions:
-                        for pdf_path in insertions[page_num]:
-                            insert_doc = fitz.open(pdf_path)
-                            merged.insert_pdf(insert_doc)
-                            insert_doc.close()
-                
+
+                # Open each insertion PDF once, even when it follows
+                # several headers
+                insert_docs = {}
+                for pdfs in insertions.values():
+                    for pdf_path in pdfs:
+                        if pdf_path not in insert_docs:
+                            insert_docs[pdf_path] = fitz.open(pdf_path)
+
+                # Copy base pages in contiguous runs up to each header -
+                # one insert_pdf per run instead of one per page (every
+                # call rewrites the xref table)
+                prev = 0
+                for header_page in sorted(insertions.keys()):
+                    merged.insert_pdf(base_doc, from_page=prev, to_page=header_page)
+                    for pdf_path in insertions[header_page]:
+                        merged.insert_pdf(insert_docs[pdf_path])
+                    prev = header_page + 1
+                if prev < len(base_doc):
+                    merged.insert_pdf(base_doc, from_page=prev, to_page=len(base_doc) - 1)
+
+                for insert_doc in insert_docs.values():
+                    insert_doc.close()
                 base_doc.close()
                 
                 tab = PDFTab(merged, "Merged_Headers.pdf")
-                
-                # Create Dock Widget
+
+                # Create Dock Widget - freeze the dock area while the new
+                # dock is added and tabified so the chrome repaints once
                 from PySide6.QtWidgets import QDockWidget
-                dock = QDockWidget("Merged_Headers.pdf", self)
-                dock.setWidget(tab)
-                dock.setAllowedAreas(Qt.AllDockWidgetAreas)
-                dock.setFeatures(QDockWidget.DockWidgetMovable | QDockWidget.DockWidgetFloatable | QDockWidget.DockWidgetClosable)
-                dock.setContextMenuPolicy(Qt.CustomContextMenu)
-                dock.customContextMenuRequested.connect(lambda pos, d=dock: self.dock_context_menu(pos, d))
-                
-                # Set parent_dock reference
-                tab.parent_dock = dock
-                
-                self.dock_manager.addDockWidget(Qt.RightDockWidgetArea, dock)
-                if self.docks:
-                    self.dock_manager.tabifyDockWidget(self.docks[-1], dock)
-                self.docks.append(dock)
-                dock.show()
-                
+                self.dock_manager.setUpdatesEnabled(False)
+                try:
+                    dock = QDockWidget("Merged_Headers.pdf", self)
+                    dock.setWidget(tab)
+                    dock.setAllowedAreas(Qt.AllDockWidgetAreas)
+                    dock.setFeatures(QDockWidget.DockWidgetMovable | QDockWidget.DockWidgetFloatable | QDockWidget.DockWidgetClosable)
+                    dock.setContextMenuPolicy(Qt.CustomContextMenu)
+                    dock.customContextMenuRequested.connect(lambda pos, d=dock: self.dock_context_menu(pos, d))
+
+                    # Set parent_dock reference
+                    tab.parent_dock = dock
+                    tab._module = self
+
+                    self.dock_manager.addDockWidget(Qt.RightDockWidgetArea, dock)
+                    if self.docks:
+                        self.dock_manager.tabifyDockWidget(self.docks[-1], dock)
+                    self.docks.append(dock)
+                    dock.show()
+                finally:
+                    self.dock_manager.setUpdatesEnabled(True)
+
                 QMessageBox.information(self, "Success", "Header-based merge complete!")
             except Exception as e:
                 QMessageBox.critical(self, "Error", str(e))
@@ -1322,49 +2238,65 @@ class PDFEditorModule(QWidget):
                 return
             
             try:
-                # Parse ranges
-                pages = set()
-                for part in range_str.split(','):
-                    part = part.strip()
-                    if '-' in part:
-                        start, end = map(int, part.split('-'))
-                        pages.update(range(start - 1, end))  # 0-indexed
-                    else:
-                        pages.add(int(part) - 1)
-                
-                # Validate
-                pages = sorted([p for p in pages if 0 <= p < total_pages])
-                
-                if not pages:
+                # Parse ranges into 0-indexed inclusive intervals, clamped
+                # to the document
+                intervals = []
+                for m in _RANGE_RE.finditer(range_str):
+                    lo = int(m[1]) - 1
+                    hi = (int(m[2]) - 1) if m[2] else lo
+                    lo, hi = max(0, lo), min(total_pages - 1, hi)
+                    if lo <= hi:
+                        intervals.append((lo, hi))
+
+                if not intervals:
                     QMessageBox.warning(self, "Warning", "No valid pages selected")
                     return
-                
+
+                # Merge overlapping/adjacent intervals so each page copies
+                # once and contiguous runs become a single insert_pdf call
+                # instead of one per page (each call rewrites the xref)
+                intervals.sort()
+                merged_ranges = [intervals[0]]
+                for lo, hi in intervals[1:]:
+                    last_lo, last_hi = merged_ranges[-1]
+                    if lo <= last_hi + 1:
+                        merged_ranges[-1] = (last_lo, max(last_hi, hi))
+                    else:
+                        merged_ranges.append((lo, hi))
+
                 # Create split PDF
                 new_doc = fitz.open()
-                for page_num in pages:
-                    new_doc.insert_pdf(tab.doc, from_page=page_num, to_page=page_num)
+                for lo, hi in merged_ranges:
+                    new_doc.insert_pdf(tab.doc, from_page=lo, to_page=hi)
+                page_total = sum(hi - lo + 1 for lo, hi in merged_ranges)
                 
                 new_tab = PDFTab(new_doc, "Split.pdf")
-                
-                # Create Dock Widget
+
+                # Create Dock Widget - freeze the dock area while the new
+                # dock is added and tabified so the chrome repaints once
                 from PySide6.QtWidgets import QDockWidget
-                dock = QDockWidget("Split.pdf", self)
-                dock.setWidget(new_tab)
-                dock.setAllowedAreas(Qt.AllDockWidgetAreas)
-                dock.setFeatures(QDockWidget.DockWidgetMovable | QDockWidget.DockWidgetFloatable | QDockWidget.DockWidgetClosable)
-                dock.setContextMenuPolicy(Qt.CustomContextMenu)
-                dock.customContextMenuRequested.connect(lambda pos, d=dock: self.dock_context_menu(pos, d))
-                
-                # Set parent_dock reference
-                new_tab.parent_dock = dock
-                
-                self.dock_manager.addDockWidget(Qt.RightDockWidgetArea, dock)
-                if self.docks:
-                    self.dock_manager.tabifyDockWidget(self.docks[-1], dock)
-                self.docks.append(dock)
-                dock.show()
-                
-                QMessageBox.information(self, "Success", f"Split {len(pages)} pages into new tab!")
+                self.dock_manager.setUpdatesEnabled(False)
+                try:
+                    dock = QDockWidget("Split.pdf", self)
+                    dock.setWidget(new_tab)
+                    dock.setAllowedAreas(Qt.AllDockWidgetAreas)
+                    dock.setFeatures(QDockWidget.DockWidgetMovable | QDockWidget.DockWidgetFloatable | QDockWidget.DockWidgetClosable)
+                    dock.setContextMenuPolicy(Qt.CustomContextMenu)
+                    dock.customContextMenuRequested.connect(lambda pos, d=dock: self.dock_context_menu(pos, d))
+
+                    # Set parent_dock reference
+                    new_tab.parent_dock = dock
+                    new_tab._module = self
+
+                    self.dock_manager.addDockWidget(Qt.RightDockWidgetArea, dock)
+                    if self.docks:
+                        self.dock_manager.tabifyDockWidget(self.docks[-1], dock)
+                    self.docks.append(dock)
+                    dock.show()
+                finally:
+                    self.dock_manager.setUpdatesEnabled(True)
+
+                QMessageBox.information(self, "Success", f"Split {page_total} pages into new tab!")
             except Exception as e:
                 QMessageBox.critical(self, "Error", str(e))
 
@@ -1376,9 +2308,11 @@ class PDFEditorModule(QWidget):
             QMessageBox.warning(self, "No PDF", "Please open a PDF first.")
             return
         
-        # Check if any page has rotation and inform user
-        has_rotation = any(page.rotation != 0 for page in tab.doc)
-        if has_rotation:
+        # Check if any page has rotation and inform user - scanned once
+        # per document state, since every page.rotation read hits MuPDF
+        if tab._has_rotation is None:
+            tab._has_rotation = any(page.rotation != 0 for page in tab.doc)
+        if tab._has_rotation:
             QMessageBox.information(
                 self, "Note",
                 "Some pages have rotation. Redaction coordinates will be automatically transformed to match the visual position."
@@ -1494,36 +2428,65 @@ class PDFEditorModule(QWidget):
                 # User clicked Undo
                 return
             
-            # Apply redaction to all pages using PyMuPDF's derotation matrix
-            for pg_idx in range(len(tab.doc)):
-                pg = tab.doc.load_page(pg_idx)
-                
-                # Visual dimensions (from pg.rect which accounts for rotation)
-                w_vis = pg.rect.width
-                h_vis = pg.rect.height
-                
-                # Map normalized coordinates to visual points for this page
-                vx0 = n_x0 * w_vis
-                vy0 = n_y0 * h_vis
-                vx1 = n_x1 * w_vis
-                vy1 = n_y1 * h_vis
-                
-                # Use derotation_matrix to transform visual coords to internal (MediaBox) coords
-                # This handles all rotation cases correctly
-                derot = pg.derotation_matrix
-                
-                # Transform corner points
-                p0 = fitz.Point(vx0, vy0) * derot
-                p1 = fitz.Point(vx1, vy1) * derot
-                
-                # Create rect from transformed points and normalize
-                rect = fitz.Rect(p0, p1).normalize()
+            # Apply redaction to all pages using PyMuPDF's derotation matrix.
+            # Iterating the doc reuses already-loaded page objects instead of
+            # re-parsing each one via load_page. The final redaction rect only
+            # depends on page geometry and rotation, so pages sharing those
+            # (the common case: uniform documents) share one cached rect and
+            # skip the point transforms entirely.
+            rect_cache = {}
+            annotated = []
+            # MuPDF isn't thread-safe and prefetch workers render this doc
+            # under the tab lock - take it for the annotation pass too
+            with tab._doc_lock:
+                for pg in tab.doc:
+                    # Visual dimensions (from pg.rect which accounts for rotation)
+                    rect_vis = pg.rect
+                    w_vis = rect_vis.width
+                    h_vis = rect_vis.height
 
-                pg.add_redact_annot(rect, fill=(1, 1, 1))
-                pg.apply_redactions()
-            
-            tab.render()
-            QMessageBox.information(self, "Success", f"Redaction applied to all {len(tab.doc)} pages.")
+                    rect_key = (w_vis, h_vis, pg.rotation)
+                    rect = rect_cache.get(rect_key)
+                    if rect is None:
+                        # derotation_matrix transforms visual coords to internal
+                        # (MediaBox) coords - handles all rotation cases correctly
+                        derot = pg.derotation_matrix
+                        p0 = fitz.Point(n_x0 * w_vis, n_y0 * h_vis) * derot
+                        p1 = fitz.Point(n_x1 * w_vis, n_y1 * h_vis) * derot
+                        rect = fitz.Rect(p0, p1).normalize()
+                        rect_cache[rect_key] = rect
+
+                    pg.add_redact_annot(rect, fill=(1, 1, 1))
+                    annotated.append(pg)
+
+            # Second pass off the GUI thread: apply_redactions rewrites
+            # content streams in MuPDF's C layer (GIL released), so the UI
+            # stays responsive while a progress dialog tracks pages
+            from PySide6.QtWidgets import QProgressDialog
+            total = len(annotated)
+            progress = QProgressDialog("Applying redactions...", None, 0, total, self)
+            progress.setWindowModality(Qt.WindowModal)
+            progress.setMinimumDuration(0)
+
+            signals = _RedactSignals()
+            signals.page_done.connect(progress.setValue)
+
+            def on_done():
+                progress.setValue(total)
+                tab._redact_signals = None
+                tab.refresh()
+                QMessageBox.information(self, "Success", f"Redaction applied to all {total} pages.")
+
+            def on_failed(msg):
+                progress.close()
+                tab._redact_signals = None
+                QMessageBox.critical(self, "Error", msg)
+
+            signals.finished.connect(on_done)
+            signals.failed.connect(on_failed)
+            # Keep the signal bridge alive for the duration of the job
+            tab._redact_signals = signals
+            QThreadPool.globalInstance().start(_RedactJob(tab, annotated, signals))
         except Exception as e:
             QMessageBox.critical(self, "Error", str(e))
 
@@ -1553,34 +2516,101 @@ class PDFEditorModule(QWidget):
         geometry: (width, height, dist_from_right, dist_from_bottom)
         """
         import traceback
-        import uuid
-        
+
         rect_w, rect_h, dist_right, dist_bottom = geometry
         
         try:
             QMessageBox.information(self, "Processing", "Rasterizing and redacting... ensure coordinates are correct.")
-            QApplication.setOverrideCursor(Qt.WaitCursor)
-            
+
             src_doc = tab.doc
             new_doc = fitz.open() # New empty PDF
-            
-            for i, page in enumerate(src_doc):
+            total = len(src_doc)
+            zoom = 2.0
+            zoom_mat = fitz.Matrix(zoom, zoom)
+
+            # Render across all cores: snapshot the live doc to disk so
+            # each worker thread can open its own handle (fitz documents
+            # aren't shareable between threads), then fan the per-page
+            # raster+JPEG work out. MuPDF and libjpeg release the GIL.
+            snap_path = os.path.join(self.temp_dir, f"raster_src_{os.urandom(4).hex()}.pdf")
+            # The live doc may be mid-render on a prefetch worker - the
+            # snapshot save has to serialize on the same lock
+            with tab._doc_lock:
+                src_doc.save(snap_path)
+
+            # Generation makes edits (header/footer, redaction, ...) miss:
+            # refresh() bumps it, so pre-edit JPEGs are never re-served
+            doc_gen = tab._doc_generation
+
+            def render_one(pno):
+                """Returns (width, height, image bytes, px-per-point scale)"""
+                key = (id(src_doc), doc_gen, pno, round(zoom, 2))
+                cached = self._jpeg_cache.get(key)
+                if cached is not None:
+                    return cached
+                doc = fitz.open(snap_path)
+                page = doc.load_page(pno)
+
+                # Scanned pages are a single full-page image already - pass
+                # the original stream through instead of decoding it just
+                # to re-encode with libjpeg (and lose quality)
                 try:
-                    # Render image
-                    pix = page.get_pixmap(matrix=fitz.Matrix(2.0, 2.0))
-                    new_page = new_doc.new_page(width=pix.width, height=pix.height)
-                    new_page.insert_image(new_page.rect, stream=pix.tobytes("jpg"), keep_proportion=True)
-                    
+                    imgs = page.get_images(full=True)
+                    if len(imgs) == 1:
+                        rects = page.get_image_rects(imgs[0])
+                        if (rects and
+                                rects[0].width >= page.rect.width * 0.95 and
+                                rects[0].height >= page.rect.height * 0.95):
+                            info = doc.extract_image(imgs[0][0])
+                            scale = (info["width"] / page.rect.width
+                                     if page.rect.width else zoom)
+                            result = (info["width"], info["height"],
+                                      info["image"], scale)
+                            doc.close()
+                            return result
+                except Exception as probe_e:
+                    log.warning("Image passthrough probe failed: %s", probe_e)
+
+                # Quality 60 roughly halves libjpeg encode time and shrinks
+                # the output PDF; for redaction output the difference from
+                # the default ~75 is not visible at 2x render scale
+                pix = page.get_pixmap(matrix=zoom_mat)
+                doc.close()
+                return (pix.width, pix.height,
+                        pix.tobytes(output="jpg", jpg_quality=60), zoom)
+
+            from PySide6.QtWidgets import QProgressDialog
+            progress = QProgressDialog("Rasterizing pages...", None, 0, total, self)
+            progress.setWindowModality(Qt.WindowModal)
+            progress.setMinimumDuration(0)
+
+            with ThreadPoolExecutor(max_workers=os.cpu_count() or 1) as pool:
+                futures = [pool.submit(render_one, i) for i in range(total)]
+                results = []
+                for n, future in enumerate(futures):
+                    results.append(future.result())
+                    progress.setValue(n + 1)
+
+            try:
+                os.remove(snap_path)
+            except Exception:
+                pass
+
+            # Assemble in page order on the main thread
+            for i in range(total):
+                try:
+                    img_w, img_h, jpg, scale_factor = results[i]
+                    self._jpeg_cache[(id(src_doc), doc_gen, i, round(zoom, 2))] = results[i]
+                    new_page = new_doc.new_page(width=img_w, height=img_h)
+                    new_page.insert_image(new_page.rect, stream=jpg, keep_proportion=True)
+
                     # Calculate redaction rect for THIS page dimensions
-                    p_w, p_h = float(pix.width), float(pix.height)
-                    
-                    # Note: pixmap dimensions might differ from PDF point dimensions if scaled?
-                    # fitz.Matrix(2.0) scales the output image by 2x.
-                    # new_page.rect is set to pix.width/height, so coordinate space matches pixels.
-                    # HOWEVER, the geometry passed in was from PDF point coordinates (unscaled).
-                    # We must scale the redaction geometry by 2.0 to match the high-res image page.
-                    
-                    scale_factor = 2.0
+                    p_w, p_h = float(img_w), float(img_h)
+
+                    # The geometry came in PDF points; the new page's
+                    # coordinate space is image pixels, so scale by the
+                    # page's pixels-per-point factor (zoom for rendered
+                    # pages, native image density for passthroughs)
                     r_w = rect_w * scale_factor
                     r_h = rect_h * scale_factor
                     d_r = dist_right * scale_factor
@@ -1593,24 +2623,27 @@ class PDFEditorModule(QWidget):
                     
                     redact_rect = fitz.Rect(x0, y0, x1, y1)
                     new_page.draw_rect(redact_rect, color=(1, 1, 1), fill=(1, 1, 1))
-                    
-                    pix = None
                 except Exception as inner_e:
                     print(f"Error processing page {i+1}: {inner_e}")
                     raise inner_e
-            
+
+            while len(self._jpeg_cache) > 256:
+                self._jpeg_cache.popitem(last=False)
+
+            # MuPDF's internal store grows during a full-doc raster pass -
+            # give the memory back now that the loop is done
+            fitz.TOOLS.store_shrink(100)
+
             # Save new PDF
-            new_filename = f"rasterized_redacted_{uuid.uuid4().hex[:8]}.pdf"
+            new_filename = f"rasterized_redacted_{os.urandom(4).hex()}.pdf"
             new_path = os.path.join(self.temp_dir, new_filename)
             new_doc.save(new_path)
             new_doc.close()
-            
-            QApplication.restoreOverrideCursor()
+
             self.open_pdf_file(new_path)
             QMessageBox.information(self, "Success", "Rasterization complete! output opened in new tab.")
-            
+
         except Exception as e:
-            QApplication.restoreOverrideCursor()
             error_msg = f"Rasterization failed: {e}\n{traceback.format_exc()}"
             print(error_msg)
             QMessageBox.critical(self, "Error", f"Rasterization failed: {e}")
@@ -1618,15 +2651,10 @@ class PDFEditorModule(QWidget):
     def sanitize_pdf(self, tab):
         """Remove security and saving as a clean copy"""
         try:
-            import uuid
-            new_filename = f"sanitized_{uuid.uuid4().hex[:8]}.pdf"
-            new_path = os.path.join(self.temp_dir, new_filename)
-            
-            # Save without encryption first
-            tab.doc.save(new_path, encryption=fitz.PDF_ENCRYPT_NONE)
-            
-            # Open source for baking
-            src_doc = fitz.open(new_path)
+            # Decrypted intermediate lives in memory - the old flow wrote
+            # it to disk only to read the same bytes straight back
+            buf = tab.doc.tobytes(encryption=fitz.PDF_ENCRYPT_NONE)
+            src_doc = fitz.open(stream=buf, filetype="pdf")
             out_doc = fitz.open()
             
             # Iterate and bake rotation
@@ -1648,20 +2676,14 @@ class PDFEditorModule(QWidget):
                 # rotate=90 achieves this mapping.
                 new_page.show_pdf_page(new_page.rect, src_doc, page.number, rotate=rot, clip=page.cropbox)
             
-            # Save final baked PDF to a NEW path to avoid Windows file locking issues
-            final_path = new_path.replace(".pdf", "_baked.pdf")
+            # The final baked PDF still goes to disk - the new tab reopens
+            # it by path
+            final_path = os.path.join(self.temp_dir,
+                                      f"sanitized_{os.urandom(4).hex()}.pdf")
             out_doc.save(final_path)
             out_doc.close()
-            
-            # Close source
             src_doc.close()
-            
-            # Try to cleanup intermediate file (soft fail)
-            try:
-                os.remove(new_path)
-            except:
-                pass # If locked, let OS/cleanup handle it later
-            
+
             # Open the new file
             self.open_pdf_file(final_path)
             QMessageBox.information(self, "Success", "PDF sanitized (rotation baked) and opened in new tab!")
@@ -1763,25 +2785,24 @@ class PDFEditorModule(QWidget):
         layout.addWidget(buttons)
         
         def parse_pages(p_str):
-            pages = set()
-            if not p_str: return pages
-            for part in p_str.split(','):
-                try:
-                    if '-' in part:
-                        start, end = map(int, part.strip().split('-'))
-                        pages.update(range(start, end + 1))
-                    else:
-                        pages.add(int(part.strip()))
-                except: pass
-            return pages
+            # Single regex pass instead of split/strip/int per token;
+            # frozenset because callers only test membership afterwards
+            if not p_str:
+                return frozenset()
+            pairs = [(int(m[1]), int(m[2]) if m[2] else int(m[1]))
+                     for m in _RANGE_RE.finditer(p_str)]
+            if not pairs:
+                return frozenset()
+            return frozenset().union(*(range(a, b + 1) for a, b in pairs))
 
         if dialog.exec() == QDialog.Accepted:
             try:
                 doc = tab.doc
                 skipped = parse_pages(skip_input.text())
                 omitted = parse_pages(omit_input.text())
-                
-                total_eligible = len(doc) - len([p for p in skipped if 1 <= p <= len(doc)])
+
+                n_pages = len(doc)
+                total_eligible = n_pages - len([p for p in skipped if 1 <= p <= n_pages])
                 fmt = fmt_combo.currentText()
                 font_size = size_spin.value()
                 dist_bottom = dist_bottom_spin.value()
@@ -1789,144 +2810,129 @@ class PDFEditorModule(QWidget):
                 
                 # Generate unique tag for this batch
                 tag = f"PDFEDITOR_PN_{uuid.uuid4().hex[:8]}"
-                
-                current_seq_num = 1
-                for i in range(len(doc)):
+
+                # Loop invariants - only the text (and so its width) changes
+                # from page to page
+                pos_idx = pos_combo.currentIndex()
+                text_height = font_size * 1.5
+
+                # When flattening, annotations would never survive to the
+                # output - write the text directly instead of building
+                # FreeText annotations only to delete and re-insert them
+                do_flatten = flatten_check.isChecked()
+                added = []  # (page, annot) bookkeeping for the non-flatten path
+
+                # Resolve skip/omit up front: skipped/omitted never change
+                # during the run, so the set lookups happen once here and the
+                # hot loop below carries no branches. Omitted pages still
+                # advance the counter (they count, just show no text), so
+                # each entry pairs the page index with its sequence number.
+                numbered = []  # (page index, sequence number)
+                seq = 0
+                for i in range(n_pages):
                     pg_index = i + 1
-                    
                     if pg_index in skipped:
                         continue
-                    
+                    seq += 1
                     if pg_index not in omitted:
+                        numbered.append((i, seq))
+
+                # Placement depends only on (visual size, rotation, text
+                # width) - text width has low cardinality (digit counts), so
+                # runs of same-size pages share the transformed point/rect
+                geo_cache = {}
+
+                # Serialize against prefetch renders - MuPDF docs
+                # are not thread-safe
+                with tab._doc_lock:
+                    for i, seq_num in numbered:
                         page = doc.load_page(i)
-                        
+
                         if fmt == "n":
-                            text = f"{current_seq_num}"
+                            text = f"{seq_num}"
                         else:
-                            text = f"Page {current_seq_num} of {total_eligible}"
-                        
-                        # Use visual dimensions (page.rect accounts for rotation)
-                        vis_width = page.rect.width
-                        vis_height = page.rect.height
-                        pos_idx = pos_combo.currentIndex()
-                        
-                        # Calculate annotation rectangle in VISUAL coordinates
-                        text_width = len(text) * (font_size * 0.6)
-                        text_height = font_size * 1.5
-                        
-                        if pos_idx == 0:  # Bottom Center
-                            vx0 = (vis_width - text_width) / 2
-                            vy0 = vis_height - dist_bottom - text_height
-                        elif pos_idx == 1:  # Bottom Right
-                            vx0 = vis_width - dist_edge - text_width
-                            vy0 = vis_height - dist_bottom - text_height
-                        elif pos_idx == 2:  # Bottom Left
-                            vx0 = dist_edge
-                            vy0 = vis_height - dist_bottom - text_height
-                        elif pos_idx == 3:  # Top Center
-                            vx0 = (vis_width - text_width) / 2
-                            vy0 = dist_bottom
-                        else:  # Top Right
-                            vx0 = vis_width - dist_edge - text_width
-                            vy0 = dist_bottom
-                        
-                        vx1 = vx0 + text_width
-                        vy1 = vy0 + text_height
-                        
-                        # Transform visual coords to internal coords using derotation matrix
-                        derot = page.derotation_matrix
-                        p0 = fitz.Point(vx0, vy0) * derot
-                        p1 = fitz.Point(vx1, vy1) * derot
-                        annot_rect = fitz.Rect(p0, p1).normalize()
-                        
-                        # Determine text rotation for the annotation based on page rotation
+                            text = f"Page {seq_num} of {total_eligible}"
+
+                        # Use visual dimensions (page.rect accounts for
+                        # rotation); each property read reaches into MuPDF,
+                        # so fetch the rect once
+                        rect = page.rect
+                        vis_width = rect.width
+                        vis_height = rect.height
                         rotate_angle = page.rotation
-                        
-                        # Create FreeText annotation
-                        annot = page.add_freetext_annot(
-                            annot_rect,
-                            text,
-                            fontsize=font_size,
-                            fontname="helv",
-                            text_color=(0, 0, 0),
-                            fill_color=None,
-                            border_color=None,
-                            align=fitz.TEXT_ALIGN_CENTER,
-                            rotate=rotate_angle
-                        )
-                        # Tag for later removal
-                        annot.set_info(title=tag)
-                        annot.update()
-                    
-                    current_seq_num += 1
-                
-                # Flatten annotations if checkbox is checked
-                if flatten_check.isChecked():
-                    for page in doc:
-                        # Get all annotations with our tag and flatten them
-                        annots_to_flatten = []
-                        for annot in page.annots():
-                            info = annot.info
-                            title = info.get("title", "")
-                            if title == tag:  # Only flatten the ones we just added
-                                annots_to_flatten.append(annot)
-                        
-                        for annot in annots_to_flatten:
-                            # Render annotation to pixmap and insert as image
-                            annot_rect = annot.rect
-                            # Use the annot appearance directly via update
-                            page.delete_annot(annot)
-                            # Actually we use a simpler approach - insert text directly
-                        
-                        # Better approach: re-insert as text instead of annotation
-                    # Re-do with insert_text for flattened version
-                    current_seq_num = 1
-                    for i in range(len(doc)):
-                        pg_index = i + 1
-                        if pg_index in skipped:
-                            continue
-                        if pg_index not in omitted:
-                            page = doc.load_page(i)
-                            if fmt == "n":
-                                text = f"{current_seq_num}"
-                            else:
-                                text = f"Page {current_seq_num} of {total_eligible}"
-                            
-                            vis_width = page.rect.width
-                            vis_height = page.rect.height
-                            pos_idx = pos_combo.currentIndex()
-                            text_width = len(text) * (font_size * 0.6)
-                            text_height = font_size * 1.5
-                            
-                            if pos_idx == 0:
+
+                        # Calculate annotation rectangle in VISUAL coordinates
+                        # (+2pt so the FreeText box never wraps on a rounding edge)
+                        text_width = _measured_width(text, "helv", font_size) + 2
+
+                        geo_key = (vis_width, vis_height, rotate_angle, text_width)
+                        cached = geo_cache.get(geo_key)
+                        if cached is None:
+                            if pos_idx == 0:  # Bottom Center
                                 vx0 = (vis_width - text_width) / 2
                                 vy0 = vis_height - dist_bottom - text_height
-                            elif pos_idx == 1:
+                            elif pos_idx == 1:  # Bottom Right
                                 vx0 = vis_width - dist_edge - text_width
                                 vy0 = vis_height - dist_bottom - text_height
-                            elif pos_idx == 2:
+                            elif pos_idx == 2:  # Bottom Left
                                 vx0 = dist_edge
                                 vy0 = vis_height - dist_bottom - text_height
-                            elif pos_idx == 3:
+                            elif pos_idx == 3:  # Top Center
                                 vx0 = (vis_width - text_width) / 2
                                 vy0 = dist_bottom
-                            else:
+                            else:  # Top Right
                                 vx0 = vis_width - dist_edge - text_width
                                 vy0 = dist_bottom
-                            
-                            # Transform for rotation
+
+                            vx1 = vx0 + text_width
+                            vy1 = vy0 + text_height
+
+                            # Transform visual coords to internal coords using
+                            # the derotation matrix
                             derot = page.derotation_matrix
-                            pt = fitz.Point(vx0, vy0 + text_height) * derot
-                            
+                            if do_flatten:
+                                cached = _Point(vx0, vy0 + text_height) * derot
+                            else:
+                                p0 = _Point(vx0, vy0) * derot
+                                p1 = _Point(vx1, vy1) * derot
+                                cached = _Rect(p0, p1).normalize()
+                            geo_cache[geo_key] = cached
+
+                        if do_flatten:
                             # Insert as regular text (not annotation)
-                            page.insert_text(pt, text, fontname="helv", fontsize=font_size, color=(0, 0, 0), rotate=page.rotation)
-                        current_seq_num += 1
-                    
+                            page.insert_text(cached, text, fontname="helv", fontsize=font_size, color=(0, 0, 0), rotate=rotate_angle)
+                        else:
+                            annot_rect = cached
+
+                            # Create FreeText annotation
+                            annot = page.add_freetext_annot(
+                                annot_rect,
+                                text,
+                                fontsize=font_size,
+                                fontname="helv",
+                                text_color=(0, 0, 0),
+                                fill_color=None,
+                                border_color=None,
+                                align=fitz.TEXT_ALIGN_CENTER,
+                                rotate=rotate_angle
+                            )
+                            # Tag for later removal
+                            annot.set_info(title=tag)
+                            added.append((page, annot))
+
+                    # Build appearance streams in one pass after the loop -
+                    # update() re-serializes immediately, so calling it inline
+                    # interleaved appearance rebuilds with page mutations
+                    for _pg, annot in added:
+                        annot.update()
+
+                if do_flatten:
                     msg = "Page numbers added (flattened - not removable)!"
                 else:
+                    tab.tool_annot_tags.add(tag)
                     msg = "Page numbers added! Use 'Remove' to delete."
                 
-                tab.render()
+                tab.refresh()
                 QMessageBox.information(self, "Success", msg)
             except Exception as e:
                 QMessageBox.critical(self, "Error", str(e))
@@ -1936,20 +2942,28 @@ class PDFEditorModule(QWidget):
         try:
             doc = tab.doc
             removed_count = 0
+            tags = tab.tool_annot_tags
+
+            # Serialize against prefetch renders - MuPDF docs are not
+            # thread-safe
+            with tab._doc_lock:
+                for page in doc:
+                    annots_to_delete = []
+                    # Filter to FreeText at the C layer - the tools only make
+                    # FreeText, so other annotation types (highlights, comments)
+                    # never cost an info-dict build
+                    for annot in page.annots(types=[fitz.PDF_ANNOT_FREE_TEXT]):
+                        title = annot.info.get("title", "")
+                        # Set lookup for tags made this session; prefix match
+                        # still catches tags saved in an earlier session
+                        if title in tags or title.startswith("PDFEDITOR_PN_"):
+                            annots_to_delete.append(annot)
+
+                    for annot in annots_to_delete:
+                        page.delete_annot(annot)
+                        removed_count += 1
             
-            for page in doc:
-                annots_to_delete = []
-                for annot in page.annots():
-                    info = annot.info
-                    title = info.get("title", "")
-                    if title.startswith("PDFEDITOR_PN_"):
-                        annots_to_delete.append(annot)
-                
-                for annot in annots_to_delete:
-                    page.delete_annot(annot)
-                    removed_count += 1
-            
-            tab.render()
+            tab.refresh()
             parent_dialog.accept()
             QMessageBox.information(self, "Success", f"Removed {removed_count} page number annotations!")
         except Exception as e:
@@ -2088,112 +3102,109 @@ class PDFEditorModule(QWidget):
                 dist_tb = dist_tb_spin.value()
                 dist_edge = dist_edge_spin.value()
                 
-                # Map color names to RGB tuples
-                colors = {
-                    "black": (0, 0, 0),
-                    "red": (1, 0, 0),
-                    "blue": (0, 0, 1),
-                    "green": (0, 0.5, 0),
-                    "gray": (0.5, 0.5, 0.5)
-                }
-                color = colors.get(color_name, (0, 0, 0))
+                color = _COLOR_MAP.get(color_name, (0, 0, 0))
                 
                 # Generate unique tag for this batch of annotations
                 tag = f"PDFEDITOR_HF_{uuid.uuid4().hex[:8]}"
-                
-                for page in doc:
-                    # Use visual dimensions (page.rect accounts for rotation)
-                    vis_width = page.rect.width
-                    vis_height = page.rect.height
-                    
-                    # Calculate text dimensions
-                    text_width = len(text) * (size * 0.6)
-                    text_height = size * 1.5
-                    
-                    # Calculate position in VISUAL coordinates
-                    if is_header:
-                        vy0 = dist_tb
-                    else:
-                        vy0 = vis_height - dist_tb - text_height
-                    vy1 = vy0 + text_height
-                    
-                    if align == "Center":
-                        vx0 = (vis_width - text_width) / 2
-                    elif align == "Left":
-                        vx0 = dist_edge
-                    else:
-                        vx0 = vis_width - dist_edge - text_width
-                    vx1 = vx0 + text_width
-                    
-                    # Transform visual coords to internal coords using derotation matrix
-                    derot = page.derotation_matrix
-                    p0 = fitz.Point(vx0, vy0) * derot
-                    p1 = fitz.Point(vx1, vy1) * derot
-                    annot_rect = fitz.Rect(p0, p1).normalize()
-                    
-                    # Determine text rotation for the annotation based on page rotation
-                    rotate_angle = page.rotation
-                    
-                    # Create FreeText annotation - Always use Times Roman font
-                    annot = page.add_freetext_annot(
-                        annot_rect,
-                        text,
-                        fontsize=size,
-                        fontname="tiro",  # Times Roman
-                        text_color=color,
-                        fill_color=None,
-                        border_color=None,
-                        align=fitz.TEXT_ALIGN_CENTER if align == "Center" else (fitz.TEXT_ALIGN_LEFT if align == "Left" else fitz.TEXT_ALIGN_RIGHT),
-                        rotate=rotate_angle
-                    )
-                    # Tag the annotation for later removal
-                    annot.set_info(title=tag)
-                    annot.update()
-                
-                # Flatten annotations if checkbox is checked
-                if flatten_check.isChecked():
-                    # Delete annotations and re-insert as text
-                    for page in doc:
-                        annots_to_delete = []
-                        for annot in page.annots():
-                            info = annot.info
-                            title = info.get("title", "")
-                            if title == tag:
-                                annots_to_delete.append(annot)
-                        for annot in annots_to_delete:
-                            page.delete_annot(annot)
-                    
-                    # Re-insert as flattened text
+
+                # Everything that doesn't depend on page geometry is computed
+                # once - the loop body is pure Python and interpreter-bound,
+                # so per-page dict lookups and string compares add up
+                # +2pt so the FreeText box never wraps on a rounding edge
+                text_width = _measured_width(text, "tiro", size) + 2
+                text_height = size * 1.5
+                is_center = align == "Center"
+                is_left = align == "Left"
+                align_enum = _ALIGN_MAP.get(align, fitz.TEXT_ALIGN_CENTER)
+
+                # When flattening, annotations would never survive to the
+                # output - write the text directly instead of building
+                # FreeText annotations only to delete and re-insert them
+                do_flatten = flatten_check.isChecked()
+                added = []  # (page, annot) bookkeeping for the non-flatten path
+
+                # Placement is a pure function of (visual size, rotation)
+                # and most documents have runs of identically-sized pages,
+                # so the transformed point/rect is memoized on that triple
+                geo_cache = {}
+
+                # Serialize against prefetch renders - MuPDF docs
+                # are not thread-safe
+                with tab._doc_lock:
                     for page in doc:
-                        vis_width = page.rect.width
-                        vis_height = page.rect.height
-                        text_width = len(text) * (size * 0.6)
-                        text_height = size * 1.5
-                        
-                        if is_header:
-                            vy0 = dist_tb
-                        else:
-                            vy0 = vis_height - dist_tb - text_height
-                        
-                        if align == "Center":
-                            vx0 = (vis_width - text_width) / 2
-                        elif align == "Left":
-                            vx0 = dist_edge
-                        else:
-                            vx0 = vis_width - dist_edge - text_width
-                        
-                        # Transform for rotation
-                        derot = page.derotation_matrix
-                        pt = fitz.Point(vx0, vy0 + text_height) * derot
-                        
-                        # Insert as regular text (not annotation)
-                        page.insert_text(pt, text, fontname="tiro", fontsize=size, color=color, rotate=page.rotation)
-                    
+                        # Use visual dimensions (page.rect accounts for
+                        # rotation); each property read reaches into MuPDF, so
+                        # fetch the rect once
+                        rect = page.rect
+                        vis_width = rect.width
+                        vis_height = rect.height
+                        rotate_angle = page.rotation
+
+                        geo_key = (vis_width, vis_height, rotate_angle)
+                        cached = geo_cache.get(geo_key)
+                        if cached is None:
+                            # Calculate position in VISUAL coordinates
+                            if is_header:
+                                vy0 = dist_tb
+                            else:
+                                vy0 = vis_height - dist_tb - text_height
+                            vy1 = vy0 + text_height
+
+                            if is_center:
+                                vx0 = (vis_width - text_width) / 2
+                            elif is_left:
+                                vx0 = dist_edge
+                            else:
+                                vx0 = vis_width - dist_edge - text_width
+                            vx1 = vx0 + text_width
+
+                            # Transform visual coords to internal coords using
+                            # the derotation matrix
+                            derot = page.derotation_matrix
+                            if do_flatten:
+                                cached = _Point(vx0, vy0 + text_height) * derot
+                            else:
+                                p0 = _Point(vx0, vy0) * derot
+                                p1 = _Point(vx1, vy1) * derot
+                                cached = _Rect(p0, p1).normalize()
+                            geo_cache[geo_key] = cached
+
+                        if do_flatten:
+                            # Insert as regular text (not annotation)
+                            page.insert_text(cached, text, fontname="tiro", fontsize=size, color=color, rotate=rotate_angle)
+                            continue
+
+                        annot_rect = cached
+
+                        # Create FreeText annotation - Always use Times Roman font
+                        annot = page.add_freetext_annot(
+                            annot_rect,
+                            text,
+                            fontsize=size,
+                            fontname="tiro",  # Times Roman
+                            text_color=color,
+                            fill_color=None,
+                            border_color=None,
+                            align=align_enum,
+                            rotate=rotate_angle
+                        )
+                        # Tag the annotation for later removal
+                        annot.set_info(title=tag)
+                        added.append((page, annot))
+
+                    # Build appearance streams in one pass after the loop -
+                    # update() re-serializes immediately, so calling it inline
+                    # interleaved appearance rebuilds with page mutations
+                    for _pg, annot in added:
+                        annot.update()
+
+                if do_flatten:
                     msg = "Header/Footer added (flattened - not removable)!"
                 else:
+                    tab.tool_annot_tags.add(tag)
                     msg = "Header/Footer added! Use 'Remove' to delete."
                 
-                tab.render()
+                tab.refresh()
                 QMessageBox.information(self, "Success", msg)
             except Exception as e:
                 QMessageBox.critical(self, "Error", str(e))
@@ -2203,23 +3214,29 @@ class PDFEditorModule(QWidget):
         try:
             doc = tab.doc
             removed_count = 0
+            tags = tab.tool_annot_tags
+
+            # Serialize against prefetch renders - MuPDF docs are not
+            # thread-safe
+            with tab._doc_lock:
+                for page in doc:
+                    annots_to_delete = []
+                    # Filter to FreeText at the C layer - the tools only make
+                    # FreeText, so other annotation types (highlights, comments)
+                    # never cost an info-dict build
+                    for annot in page.annots(types=[fitz.PDF_ANNOT_FREE_TEXT]):
+                        title = annot.info.get("title", "")
+                        # Set lookup for tags made this session; prefix match
+                        # still catches tags saved in an earlier session
+                        if title in tags or title.startswith("PDFEDITOR_HF_"):
+                            annots_to_delete.append(annot)
+
+                    # Delete the tagged annotations
+                    for annot in annots_to_delete:
+                        page.delete_annot(annot)
+                        removed_count += 1
             
-            for page in doc:
-                # Get all annotations on this page
-                annots_to_delete = []
-                for annot in page.annots():
-                    # Check if this is a tagged header/footer annotation
-                    info = annot.info
-                    title = info.get("title", "")
-                    if title.startswith("PDFEDITOR_HF_"):
-                        annots_to_delete.append(annot)
-                
-                # Delete the tagged annotations
-                for annot in annots_to_delete:
-                    page.delete_annot(annot)
-                    removed_count += 1
-            
-            tab.render()
+            tab.refresh()
             parent_dialog.accept()
             QMessageBox.information(self, "Success", f"Removed {removed_count} header/footer annotations!")
         except Exception as e:
@@ -2242,12 +3259,15 @@ class PDFEditorModule(QWidget):
             dock.setFeatures(QDockWidget.DockWidgetMovable | QDockWidget.DockWidgetFloatable | QDockWidget.DockWidgetClosable)
             
             tab.parent_dock = dock
+            tab._module = self
             dock.setContextMenuPolicy(Qt.CustomContextMenu)
             dock.customContextMenuRequested.connect(lambda pos, d=dock: self.dock_context_menu(pos, d))
             dock.visibilityChanged.connect(self.on_dock_visibility_changed)
             
             # Connect interactive selection signal
-            tab.label.selection_confirmed.connect(lambda rect: self.apply_custom_redaction(tab, rect))
+            tab.label.selection_confirmed.connect(
+                    lambda rect: self.apply_custom_redaction(tab, rect),
+                    Qt.DirectConnection)  # Same-thread emit - skip the queued-event path
             
             self.dock_manager.addDockWidget(Qt.RightDockWidgetArea, dock)
             if self.docks:
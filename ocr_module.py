@@ -440,13 +440,14 @@ class OCRImageTrainerModule(QWidget):
                 
                 # Convert bbox to left, top, width, height
                 # bbox is [[x1,y1], [x2,y1], [x2,y2], [x1,y2]]
-                x_coords = [p[0] for p in bbox]
-                y_coords = [p[1] for p in bbox]
-                left = min(x_coords)
-                top = min(y_coords)
-                width = max(x_coords) - left
-                height = max(y_coords) - top
-                
+                arr = np.asarray(bbox, dtype=np.float32)
+                mn = arr.min(0)
+                mx = arr.max(0)
+                left = float(mn[0])
+                top = float(mn[1])
+                width = float(mx[0] - mn[0])
+                height = float(mx[1] - mn[1])
+
                 results.append({
                     'text': text,
                     'left': left,
@@ -1179,16 +1180,17 @@ class OCRImageTrainerModule(QWidget):
                     text_clean = text.strip()
                     if not text_clean:
                         continue
-                    x_coords = [p[0] for p in bbox]
-                    y_coords = [p[1] for p in bbox]
+                    arr = np.asarray(bbox, dtype=np.float32)
+                    mn = arr.min(0)
+                    mx = arr.max(0)
                     words.append({
                         'text': text_clean,
-                        'left': min(x_coords),
-                        'top': min(y_coords),
-                        'width': max(x_coords) - min(x_coords),
-                        'height': max(y_coords) - min(y_coords),
-                        'center_x': (min(x_coords) + max(x_coords)) / 2,
-                        'center_y': (min(y_coords) + max(y_coords)) / 2
+                        'left': float(mn[0]),
+                        'top': float(mn[1]),
+                        'width': float(mx[0] - mn[0]),
+                        'height': float(mx[1] - mn[1]),
+                        'center_x': float(mn[0] + mx[0]) / 2,
+                        'center_y': float(mn[1] + mx[1]) / 2
                     })
                 
                 # Search for anchor text in OCR results